@@ -25,6 +25,14 @@ class Settings:
     GEMINI_MODEL: str = os.getenv("GEMINI_MODEL", "gemini-1.5-pro")
     EMBEDDING_MODEL: str = os.getenv("EMBEDDING_MODEL", "text-embedding-004")
     
+    # Hugging Face settings (signal extraction is short tagging, so a smaller
+    # model suffices; warm the hosted model when the agent starts)
+    EXTRACTION_MODEL: str = os.getenv("EXTRACTION_MODEL", "google/flan-t5-base")
+    # Input tokens the extraction model reads (flan-t5: 512); sizes batched prompts,
+    # so raise it together with EXTRACTION_MODEL for larger-context models
+    EXTRACTION_CONTEXT_TOKENS: int = int(os.getenv("EXTRACTION_CONTEXT_TOKENS", "512"))
+    HF_WARMUP: bool = os.getenv("HF_WARMUP", "true").lower() in ["true", "1", "yes"]
+    
     # Gmail API settings
     GMAIL_SCOPES: list = [
         "https://www.googleapis.com/auth/gmail.readonly",
@@ -63,6 +71,14 @@ class Settings:
     # Processing settings
     BATCH_SIZE: int = int(os.getenv("BATCH_SIZE", "10"))
     MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "3"))
+    MAX_PIPELINE_WORKERS: int = int(os.getenv("MAX_PIPELINE_WORKERS", "8"))
+    
+    # On-disk LLM memo cache for inventory memos (empty path = <data_dir>/.memo_cache)
+    MEMO_CACHE_ENABLED: bool = os.getenv("MEMO_CACHE_ENABLED", "true").lower() in ["true", "1", "yes"]
+    MEMO_CACHE_PATH: str = os.getenv("MEMO_CACHE_PATH", "")
+    
+    # Console output (metrics banner is printed on a TTY or when forced)
+    VERBOSE_CONSOLE: bool = os.getenv("VERBOSE_CONSOLE", "false").lower() in ["true", "1", "yes"]
 
 
 # Singleton settings instance
@@ -0,0 +1,10 @@
+"""
+Pytest configuration shared by the script-style and tests/ suites.
+
+Keeps test runs independent of each other: the inventory balancer's on-disk
+LLM memo cache is switched off unless a test opts in with an explicit path.
+"""
+
+from config.settings import settings
+
+settings.MEMO_CACHE_ENABLED = False
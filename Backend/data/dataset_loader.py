@@ -5,8 +5,9 @@ Production-grade CSV data loading with normalization and accessors.
 
 import csv
 import logging
+import sys
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, NamedTuple, Optional, Any
 from pathlib import Path
 
 from utils.helpers import setup_logging
@@ -14,14 +15,59 @@ from utils.helpers import setup_logging
 logger = setup_logging()
 
 
+class SalesOrderRow(NamedTuple):
+    """Typed sales order record for hot loops (attribute access instead of dict.get)."""
+    sales_order_id: Optional[str]
+    model: Optional[str]
+    version: Optional[str]
+    quantity: int
+    order_type: str
+    customer_id: Optional[str]
+    material_id: Optional[str]
+    
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> "SalesOrderRow":
+        """Build a record from a normalized sales order dict."""
+        # order_type is repeated on every row and used as a dict key downstream;
+        # interning lets those lookups short-circuit on identity
+        order_type = row.get('order_type', 'unknown')
+        if isinstance(order_type, str):
+            order_type = sys.intern(order_type)
+        
+        return cls(
+            sales_order_id=row.get('sales_order_id'),
+            model=row.get('model'),
+            version=row.get('version'),
+            quantity=int(row.get('quantity', 0)),
+            order_type=order_type,
+            customer_id=row.get('customer_id'),
+            material_id=row.get('material_id')
+        )
+
+
 class SimpleDataFrame:
     """Simple DataFrame-like class for CSV data without pandas."""
     
     def __init__(self, data: List[Dict[str, Any]], columns: List[str]):
+        self._records: Dict[type, tuple] = {}
         self.data = data
         self.columns = [col.lower().strip() for col in columns]
         self._normalize_columns()
     
+    @property
+    def data(self) -> List[Dict[str, Any]]:
+        return self._data
+    
+    @data.setter
+    def data(self, rows: List[Dict[str, Any]]) -> None:
+        # Replacing the rows drops any typed records built from the old ones
+        self._data = rows
+        self._records.clear()
+    
+    def invalidate(self) -> None:
+        """Drop memoized typed records (call after editing rows in place)."""
+        self._records.clear()
+    
     def _normalize_columns(self):
         """Normalize column names and data."""
         for row in self.data:
@@ -44,6 +90,33 @@ class SimpleDataFrame:
         if 0 <= index < len(self.data):
             return SimpleRow(self.data[index])
         raise IndexError("Index out of range")
+    
+    def to_records(self, record_type) -> list:
+        """
+        Convert rows to typed records (built once per record type).
+        
+        The memo is rebuilt when rows are replaced, added or removed; call
+        invalidate() after editing a row in place. Rows that don't convert
+        (e.g. a blank or non-numeric quantity) are logged and skipped, so one
+        bad CSV row can't break every consumer.
+        
+        Args:
+            record_type: NamedTuple class exposing a from_row(dict) constructor
+            
+        Returns:
+            List of record_type instances, in row order
+        """
+        # Memo is stamped with the row count, so appends/removals rebuild it
+        row_count, records = self._records.get(record_type, (None, None))
+        if records is None or row_count != len(self._data):
+            records = []
+            for row in self._data:
+                try:
+                    records.append(record_type.from_row(row))
+                except (ValueError, TypeError) as e:
+                    logger.warning(f"Skipping malformed {record_type.__name__} row {row}: {e}")
+            self._records[record_type] = (len(self._data), records)
+        return records
 
 
 class SimpleRow:
@@ -84,6 +157,11 @@ class DatasetLoader:
         # Set reference date from sales orders
         self.reference_date = self._calculate_reference_date()
         
+        # BOM index, built lazily on first lookup
+        self._bom_index: Optional[Dict[tuple, List[Dict[str, Any]]]] = None
+        self._bom_part_index: Optional[Dict[tuple, Dict[str, int]]] = None
+        self._bom_by_part: Optional[Dict[str, Dict[tuple, int]]] = None
+        
         logger.info(f"DatasetLoader initialized with all CSV files")
         # --- IN Backend/data/dataset_loader.py ---
 
@@ -414,13 +492,69 @@ class DatasetLoader:
         if not self.bom:
             return []
         
-        bom_entries = []
-        for row in self.bom.data:
-            if (row.get('model') == model and 
-                row.get('version') == version):
-                bom_entries.append(row)
+        if self._bom_index is None:
+            self._build_bom_index()
         
-        return bom_entries
+        return list(self._bom_index.get((model, version), []))
+    
+    def get_bom_part_quantities(self) -> Dict[tuple, Dict[str, int]]:
+        """
+        Get BOM quantities indexed by model/version and part.
+        
+        Returns:
+            Dict mapping (model, version) to {part_id: qty_per_unit}
+        """
+        if not self.bom:
+            return {}
+        
+        if self._bom_part_index is None:
+            self._build_bom_index()
+        
+        return self._bom_part_index
+    
+    def get_part_bom(self, part_id: str) -> Dict[tuple, int]:
+        """
+        Get every model/version that uses a part.
+        
+        Args:
+            part_id: Part identifier
+            
+        Returns:
+            Dict mapping (model, version) to qty_per_unit (empty if the part is in no BOM)
+        """
+        if not self.bom:
+            return {}
+        
+        if self._bom_by_part is None:
+            self._build_bom_index()
+        
+        return self._bom_by_part.get(part_id, {})
+    
+    def _build_bom_index(self) -> None:
+        """Index BOM rows by (model, version) in a single pass."""
+        bom_index = {}
+        part_index = {}
+        
+        for row in self.bom.data:
+            key = (row.get('model'), row.get('version'))
+            bom_index.setdefault(key, []).append(row)
+            
+            part_id = row.get('part_id')
+            if part_id is not None and part_id not in part_index.setdefault(key, {}):
+                try:
+                    part_index[key][part_id] = int(row.get('qty_per_unit', 1))
+                except (ValueError, TypeError) as e:
+                    # Still listed by get_bom_mapping; just left out of the quantity indexes
+                    logger.warning(f"Skipping malformed BOM row {row}: {e}")
+        
+        by_part = {}
+        for key, parts in part_index.items():
+            for part_id, qty_per_unit in parts.items():
+                by_part.setdefault(part_id, {})[key] = qty_per_unit
+        
+        self._bom_index = bom_index
+        self._bom_part_index = part_index
+        self._bom_by_part = by_part
     
     def get_all_materials(self) -> List[str]:
         """
@@ -445,4 +579,4 @@ class DatasetLoader:
 
 
 # Export for integration
-__all__ = ["DatasetLoader"]
+__all__ = ["DatasetLoader", "SalesOrderRow"]
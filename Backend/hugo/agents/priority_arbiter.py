@@ -3,17 +3,37 @@ Hugo - Priority Wars Arbiter
 
 Deterministic-first priority allocation agent for stock conflicts.
 Resolves allocation disputes when demand exceeds available stock.
+
+Performance note: arbitration is interpreter/memory-bound (per-row lookups,
+per-order result objects, BOM access), not compute-bound - there is no arithmetic
+kernel worth vectorizing. Optimizations here should reduce Python overhead,
+cache (BOM indexes, per-material memo), or restructure data (bulk API, typed rows).
 """
 
+import functools
 import logging
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from dataclasses import dataclass, replace
 from datetime import datetime
 
+from data.dataset_loader import DatasetLoader, SalesOrderRow
+
 logger = logging.getLogger("hugo")
 
 
-@dataclass
+class PartDemand(NamedTuple):
+    """Part-level demand derived from one sales order via the BOM."""
+    order_id: str
+    order_type: str
+    model: Optional[str]
+    version: Optional[str]
+    order_quantity: int
+    qty_per_unit: int
+    total_quantity: int
+
+
+@dataclass(slots=True, frozen=True)
 class AllocationResult:
     """Result of priority allocation for a single order."""
     order_id: str
@@ -24,7 +44,7 @@ class AllocationResult:
     customer_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class PriorityResolution:
     """Complete priority conflict resolution result."""
     material: str
@@ -33,7 +53,16 @@ class PriorityResolution:
     allocation: Dict[str, List[AllocationResult]]  # {"fulfilled": [...], "partial": [...], "delayed": [...]}
     delayed_orders: List[str]  # Order IDs that were delayed
     summary: str  # Short text summary
-    explanation: Optional[str] = None  # LLM-generated customer explanation
+    explanation: Optional[str] = None  # LLM-generated customer explanation (see PriorityArbiter.explain)
+
+
+def _copy_resolution(resolution: PriorityResolution) -> PriorityResolution:
+    """Copy a resolution with fresh containers (AllocationResult entries are frozen, so shared)."""
+    return replace(
+        resolution,
+        allocation={status: list(results) for status, results in resolution.allocation.items()},
+        delayed_orders=list(resolution.delayed_orders)
+    )
 
 
 class PriorityArbiter:
@@ -51,16 +80,30 @@ class PriorityArbiter:
         "webshop": 3          # Lowest priority - margin
     }
     
-    def __init__(self, logger=None, llm_client=None):
+    # Max resolutions (and generated explanations) kept for repeated (material, stock, orders) calls
+    RESOLUTION_CACHE_SIZE = 256
+    
+    # Oversubscribed tiers up to these sizes are packed exactly instead of greedily
+    KNAPSACK_MAX_ORDERS = 200
+    KNAPSACK_MAX_STOCK = 100_000
+    
+    def __init__(self, logger=None, llm_client=None, dataset_loader=None):
         """
         Initialize Priority Arbiter.
         
         Args:
             logger: Logger instance (defaults to hugo logger)
             llm_client: Optional LLM client for explanation generation
+            dataset_loader: Optional DatasetLoader for BOM access (created on first use if omitted)
         """
         self.logger = logger or logging.getLogger("hugo")
         self.llm_client = llm_client
+        self._dataset_loader = dataset_loader
+        self._resolution_cache: "OrderedDict[tuple, PriorityResolution]" = OrderedDict()
+        self._explanation_cache: "OrderedDict[tuple, str]" = OrderedDict()
+        self._orders_seen = None  # Last sales orders frame seen, its row snapshot and version
+        self._orders_snapshot: Optional[tuple] = None
+        self._orders_version = 0
         
         self.logger.info("PriorityArbiter initialized")
     
@@ -76,51 +119,159 @@ class PriorityArbiter:
         Returns:
             PriorityResolution with allocation plan
         """
-        self.logger.info(f"Resolving priority conflict for {material_id}: {available_stock} available")
+        self.logger.info("Resolving priority conflict for %s: %s available", material_id, available_stock)
         
         try:
-            # Expand sales orders into part-level demand using BOM
-            part_demand = self._calculate_part_demand(material_id, sales_orders_df)
+            # Replanning loops often ask again with unchanged inputs
+            cache_key = (material_id, available_stock, self._orders_fingerprint(sales_orders_df))
+            cached = self._cached_resolution(cache_key)
+            if cached is not None:
+                self.logger.debug("Reusing cached resolution for %s", material_id)
+                return cached
             
-            if not part_demand:
-                return self._create_empty_resolution(material_id, available_stock)
-            
-            # Group part demand by order_type
-            grouped_demand = self._group_part_demand_by_type(part_demand)
-            
-            # Sort groups by priority (fleet_framework > fleet_spot > webshop)
-            sorted_groups = self._sort_by_priority(grouped_demand)
-            
-            # Allocate stock greedily by priority
-            allocation_plan = self._allocate_part_stock(available_stock, sorted_groups)
-            
-            # Calculate total demand
-            total_demand = sum(demand['total_quantity'] for demand in part_demand)
-            
-            # Generate summary
-            summary = self._generate_summary(material_id, available_stock, total_demand, allocation_plan)
-            
-            # Create resolution result
-            resolution = PriorityResolution(
-                material=material_id,
-                available_stock=available_stock,
-                total_demand=total_demand,
-                allocation=allocation_plan,
-                delayed_orders=[order.order_id for order in allocation_plan.get("delayed", [])],
-                summary=summary,
-                explanation=None  # No LLM for this implementation
-            )
-            
-            self.logger.info(f"Priority resolution complete for {material_id}: {len(allocation_plan.get('fulfilled', []))} fulfilled, {len(allocation_plan.get('delayed', []))} delayed")
+            # Expand sales orders into part-level demand using BOM
+            part_demand, total_demand = self._calculate_part_demand(material_id, sales_orders_df)
             
+            resolution = self._resolve_part_demand(material_id, available_stock, part_demand, total_demand)
+            self._cache_resolution(cache_key, resolution)
             return resolution
             
         except Exception as e:
-            self.logger.error(f"Error resolving priority conflict for {material_id}: {e}")
+            self.logger.error("Error resolving priority conflict for %s: %s", material_id, e)
             # Return safe fallback
             return self._create_fallback_resolution(material_id, available_stock)
     
-    def _calculate_part_demand(self, part_id: str, sales_orders_df) -> List[Dict]:
+    def resolve_conflicts_bulk(self, stocks: Dict[str, int], sales_orders_df) -> Dict[str, PriorityResolution]:
+        """
+        Resolve priority conflicts for many materials with a single BOM expansion.
+        
+        Args:
+            stocks: Mapping of material identifier (part_id) to available stock
+            sales_orders_df: Sales orders data (SimpleDataFrame)
+            
+        Returns:
+            Dict mapping material identifier to its PriorityResolution
+        """
+        self.logger.info("Resolving priority conflicts for %d materials", len(stocks))
+        
+        try:
+            fingerprint = self._orders_fingerprint(sales_orders_df)
+            demand_by_part, total_by_part = self._expand_part_demand(sales_orders_df, stocks.keys())
+        except Exception as e:
+            self.logger.error("Error expanding part demand for bulk resolution: %s", e)
+            return {
+                material_id: self._create_fallback_resolution(material_id, available_stock)
+                for material_id, available_stock in stocks.items()
+            }
+        
+        resolutions = {}
+        for material_id, available_stock in stocks.items():
+            cache_key = (material_id, available_stock, fingerprint)
+            cached = self._cached_resolution(cache_key)
+            if cached is not None:
+                resolutions[material_id] = cached
+                continue
+            
+            try:
+                resolution = self._resolve_part_demand(
+                    material_id,
+                    available_stock,
+                    demand_by_part.get(material_id, []),
+                    total_by_part.get(material_id, 0)
+                )
+                self._cache_resolution(cache_key, resolution)
+            except Exception as e:
+                self.logger.error("Error resolving priority conflict for %s: %s", material_id, e)
+                resolution = self._create_fallback_resolution(material_id, available_stock)
+            
+            resolutions[material_id] = resolution
+        
+        return resolutions
+    
+    def _resolve_part_demand(self, material_id: str, available_stock: int, part_demand: List[PartDemand], total_demand: int) -> PriorityResolution:
+        """
+        Allocate stock against already-expanded part demand.
+        
+        Args:
+            material_id: Material identifier (part_id)
+            available_stock: Available stock quantity
+            part_demand: Part demand entries for this material
+            total_demand: Sum of total_quantity over part_demand
+            
+        Returns:
+            PriorityResolution with allocation plan
+        """
+        if not part_demand:
+            return self._create_empty_resolution(material_id, available_stock)
+        
+        # Bucket part demand by order_type, already in priority order
+        sorted_groups = self._group_by_priority(part_demand)
+        
+        # Allocate stock greedily by priority (fleet_framework > fleet_spot > webshop)
+        allocation_plan, counts, delayed_ids = self._allocate_part_stock(available_stock, sorted_groups)
+        
+        # Generate summary
+        summary = self._generate_summary(material_id, available_stock, total_demand, counts)
+        
+        # Create resolution result
+        resolution = PriorityResolution(
+            material=material_id,
+            available_stock=available_stock,
+            total_demand=total_demand,
+            allocation=allocation_plan,
+            delayed_orders=delayed_ids,
+            summary=summary,
+            explanation=None  # Generated on request via explain(), never during arbitration
+        )
+        
+        self.logger.info(
+            "Priority resolution complete for %s: %d fulfilled, %d delayed",
+            material_id, counts["fulfilled"], counts["delayed"]
+        )
+        
+        return resolution
+    
+    def _orders_fingerprint(self, sales_orders_df) -> int:
+        """
+        Version of the sales orders, used as part of the cache key.
+        
+        The raw rows are compared against the last snapshot on every call (not
+        the memoized records), so a new frame or any in-place edit bumps the
+        version and drops the resolutions cached for the old one. Only one
+        snapshot is kept, and keys stay small.
+        """
+        snapshot = tuple(tuple(row.items()) for row in sales_orders_df.data)
+        if sales_orders_df is not self._orders_seen or snapshot != self._orders_snapshot:
+            # Rows may have been edited in place: rebuild typed records from them
+            sales_orders_df.invalidate()
+            self._orders_seen = sales_orders_df
+            self._orders_snapshot = snapshot
+            self._orders_version += 1
+            self._resolution_cache.clear()
+        return self._orders_version
+    
+    def _cached_resolution(self, cache_key: tuple) -> Optional[PriorityResolution]:
+        """Return a private copy of a cached resolution, if any."""
+        cached = self._resolution_cache.get(cache_key)
+        if cached is None:
+            return None
+        self._resolution_cache.move_to_end(cache_key)
+        return _copy_resolution(cached)
+    
+    def _cache_resolution(self, cache_key: tuple, resolution: PriorityResolution) -> None:
+        """Store a copy of a resolution, evicting the least recently used entry when full."""
+        self._resolution_cache[cache_key] = _copy_resolution(resolution)
+        if len(self._resolution_cache) > self.RESOLUTION_CACHE_SIZE:
+            self._resolution_cache.popitem(last=False)
+    
+    @property
+    def dataset_loader(self):
+        """DatasetLoader used for BOM access, shared across calls."""
+        if self._dataset_loader is None:
+            self._dataset_loader = DatasetLoader()
+        return self._dataset_loader
+    
+    def _calculate_part_demand(self, part_id: str, sales_orders_df) -> Tuple[List[PartDemand], int]:
         """
         Calculate part-level demand from sales orders using BOM mapping.
         
@@ -129,159 +280,250 @@ class PriorityArbiter:
             sales_orders_df: Sales orders data
             
         Returns:
-            List of part demand entries
+            Tuple of (part demand entries, total part demand)
         """
         part_demand = []
+        total_demand = 0
         
-        # Get dataset loader for BOM access
-        from data.dataset_loader import DatasetLoader
-        dataset_loader = DatasetLoader()
+        # {(model, version): qty_per_unit} for the models that use this part
+        part_bom = self.dataset_loader.get_part_bom(part_id)
+        if not part_bom:
+            # Part is not in any BOM - no need to touch the sales orders
+            return part_demand, total_demand
         
-        for sales_order in sales_orders_df.data:
-            model = sales_order.get('model')
-            version = sales_order.get('version')
-            order_quantity = int(sales_order.get('quantity', 0))
-            order_type = sales_order.get('order_type', 'unknown')
-            order_id = sales_order.get('sales_order_id', f'unknown_{len(part_demand)}')
+        for sales_order in sales_orders_df.to_records(SalesOrderRow):
+            # Hash join against the part's BOM instead of scanning entries
+            qty_per_unit = part_bom.get((sales_order.model, sales_order.version))
+            if qty_per_unit is None:
+                continue
             
-            # Get BOM mapping for this model/version
-            bom_entries = dataset_loader.get_bom_mapping(model, version)
+            order_id = sales_order.sales_order_id
+            if order_id is None:
+                order_id = f'unknown_{len(part_demand)}'
             
-            # Find if this part is in the BOM
-            for bom_entry in bom_entries:
-                if bom_entry.get('part_id') == part_id:
-                    qty_per_unit = int(bom_entry.get('qty_per_unit', 1))
-                    total_part_demand = order_quantity * qty_per_unit
-                    
-                    part_demand.append({
-                        'order_id': order_id,
-                        'order_type': order_type,
-                        'model': model,
-                        'version': version,
-                        'order_quantity': order_quantity,
-                        'qty_per_unit': qty_per_unit,
-                        'total_quantity': total_part_demand
-                    })
-                    break
+            total_quantity = sales_order.quantity * qty_per_unit
+            total_demand += total_quantity
+            part_demand.append(PartDemand(
+                order_id=order_id,
+                order_type=sales_order.order_type,
+                model=sales_order.model,
+                version=sales_order.version,
+                order_quantity=sales_order.quantity,
+                qty_per_unit=qty_per_unit,
+                total_quantity=total_quantity
+            ))
         
-        self.logger.debug(f"Calculated part demand for {part_id}: {len(part_demand)} entries")
-        return part_demand
+        self.logger.debug("Calculated part demand for %s: %d entries", part_id, len(part_demand))
+        return part_demand, total_demand
     
-    def _group_part_demand_by_type(self, part_demand: List[Dict]) -> Dict[str, List[Dict]]:
-        """Group part demand by order_type."""
-        grouped = {}
-        
-        for demand in part_demand:
-            order_type = demand.get('order_type', 'unknown')
-            if order_type not in grouped:
-                grouped[order_type] = []
-            grouped[order_type].append(demand)
-        
-        self.logger.debug(f"Grouped part demand by type: {list(grouped.keys())}")
-        return grouped
+    def _expand_part_demand(self, sales_orders_df, part_ids) -> Tuple[Dict[str, List[PartDemand]], Dict[str, int]]:
+        """
+        Expand sales orders into part-level demand for several parts in one pass.
+        
+        Args:
+            sales_orders_df: Sales orders data
+            part_ids: Part identifiers to collect demand for
+            
+        Returns:
+            Tuple of (part_id -> part demand entries in sales order order, part_id -> total part demand)
+        """
+        wanted = set(part_ids)
+        demand_by_part = {}
+        total_by_part = {}
+        
+        # {(model, version): {part_id: qty_per_unit}} - built once per loader
+        bom_index = self.dataset_loader.get_bom_part_quantities()
+        
+        for sales_order in sales_orders_df.to_records(SalesOrderRow):
+            bom_parts = bom_index.get((sales_order.model, sales_order.version))
+            if not bom_parts:
+                continue
+            
+            for part_id, qty_per_unit in bom_parts.items():
+                if part_id not in wanted:
+                    continue
+                
+                part_demand = demand_by_part.setdefault(part_id, [])
+                order_id = sales_order.sales_order_id
+                if order_id is None:
+                    order_id = f'unknown_{len(part_demand)}'
+                
+                total_quantity = sales_order.quantity * qty_per_unit
+                total_by_part[part_id] = total_by_part.get(part_id, 0) + total_quantity
+                part_demand.append(PartDemand(
+                    order_id=order_id,
+                    order_type=sales_order.order_type,
+                    model=sales_order.model,
+                    version=sales_order.version,
+                    order_quantity=sales_order.quantity,
+                    qty_per_unit=qty_per_unit,
+                    total_quantity=total_quantity
+                ))
+        
+        self.logger.debug("Expanded part demand for %d of %d parts", len(demand_by_part), len(wanted))
+        return demand_by_part, total_by_part
     
-    def _allocate_part_stock(self, available_stock: int, sorted_groups: List[Tuple[str, List[Dict]]]) -> Dict[str, List[AllocationResult]]:
+    def _group_by_priority(self, items: list) -> List[Tuple[str, list]]:
+        """
+        Bucket demand entries by order_type and return the buckets in priority order.
+        
+        Works for anything carrying an ``order_type`` (PartDemand, SalesOrderRow).
+        Buckets are ordered by (priority, order_type) so unknown types stay deterministic.
+        
+        Args:
+            items: Demand entries in arrival order
+            
+        Returns:
+            List of (order_type, entries) tuples, highest priority first
+        """
+        buckets = {}
+        
+        for item in items:
+            bucket = buckets.get(item.order_type)
+            if bucket is None:
+                bucket = buckets[item.order_type] = []
+            bucket.append(item)
+        
+        rules = self.PRIORITY_RULES
+        sorted_groups = sorted(buckets.items(), key=lambda group: (rules.get(group[0], 999), group[0]))
+        
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Priority order: %s", [order_type for order_type, _ in sorted_groups])
+        return sorted_groups
+    
+    def _allocate_part_stock(self, available_stock: int, sorted_groups: List[Tuple[str, List[PartDemand]]]) -> Tuple[Dict[str, List[AllocationResult]], Dict[str, int], List[str]]:
         """
         Allocate stock to part-level demand by priority.
         
+        Once stock runs out, the remaining groups are marked delayed without the
+        greedy checks.
+        
         Args:
             available_stock: Available stock quantity
-            sorted_groups: Demand groups sorted by priority
+            sorted_groups: Demand groups in priority order (see _group_by_priority)
             
         Returns:
-            Dictionary with "fulfilled", "partial", "delayed" allocation results
+            Tuple of (allocation dict with "fulfilled", "partial", "delayed" results,
+            per-status counts, delayed order ids)
         """
-        allocation = {"fulfilled": [], "partial": [], "delayed": []}
+        fulfilled, partial, delayed = [], [], []
+        append_fulfilled = fulfilled.append
+        append_partial = partial.append
+        counts = {"fulfilled": 0, "partial": 0, "delayed": 0}
         remaining_stock = available_stock
         
-        for order_type, demands in sorted_groups:
+        # Hoisted out of the per-demand loop: one builder per status
+        AR = AllocationResult
+        build_fulfilled = functools.partial(AR, status="fulfilled")
+        build_partial = functools.partial(AR, status="partial")
+        build_delayed = functools.partial(AR, allocated_quantity=0, status="delayed")
+        debug = self.logger.debug
+        
+        # Demand left over once stock runs out: (order_type, demands) pairs
+        tail = []
+        
+        for group_index, (order_type, demands) in enumerate(sorted_groups):
+            if remaining_stock <= 0:
+                tail.extend(sorted_groups[group_index:])
+                break
+            
             priority = self.PRIORITY_RULES.get(order_type, 999)
-            self.logger.debug(f"Processing {order_type} demands (priority {priority}), remaining stock: {remaining_stock}")
+            debug("Processing %s demands (priority %d), remaining stock: %d", order_type, priority, remaining_stock)
             
-            for demand in demands:
-                order_id = demand.get('order_id', f'unknown_{len(allocation["fulfilled"])}')
-                requested_quantity = demand.get('total_quantity', 0)
-                model = demand.get('model', 'unknown')
+            selection = self._select_tier_orders([demand.total_quantity for demand in demands], remaining_stock)
+            if selection is not None:
+                # Oversubscribed tier: fill exactly, top up one order, delay the rest
+                skipped = []
+                for demand, selected in zip(demands, selection):
+                    if selected:
+                        append_fulfilled(build_fulfilled(
+                            order_id=demand.order_id,
+                            order_type=order_type,
+                            requested_quantity=demand.total_quantity,
+                            allocated_quantity=demand.total_quantity
+                        ))
+                        counts["fulfilled"] += 1
+                        remaining_stock -= demand.total_quantity
+                    else:
+                        skipped.append(demand)
+                
+                if remaining_stock > 0:
+                    demand = skipped.pop(0)
+                    append_partial(build_partial(
+                        order_id=demand.order_id,
+                        order_type=order_type,
+                        requested_quantity=demand.total_quantity,
+                        allocated_quantity=remaining_stock
+                    ))
+                    counts["partial"] += 1
+                    remaining_stock = 0
+                
+                tail.append((order_type, skipped))
+                continue
+            
+            for position, demand in enumerate(demands):
+                if remaining_stock <= 0:
+                    tail.append((order_type, demands[position:]))
+                    break
+                
+                requested_quantity = demand.total_quantity
                 
                 if remaining_stock >= requested_quantity:
                     # Full fulfillment
-                    allocation_result = AllocationResult(
-                        order_id=order_id,
+                    append_fulfilled(build_fulfilled(
+                        order_id=demand.order_id,
                         order_type=order_type,
                         requested_quantity=requested_quantity,
-                        allocated_quantity=requested_quantity,
-                        status="fulfilled"
-                    )
-                    allocation["fulfilled"].append(allocation_result)
+                        allocated_quantity=requested_quantity
+                    ))
+                    counts["fulfilled"] += 1
                     remaining_stock -= requested_quantity
                     
-                elif remaining_stock > 0:
+                else:
                     # Partial fulfillment
-                    allocation_result = AllocationResult(
-                        order_id=order_id,
+                    append_partial(build_partial(
+                        order_id=demand.order_id,
                         order_type=order_type,
                         requested_quantity=requested_quantity,
-                        allocated_quantity=remaining_stock,
-                        status="partial"
-                    )
-                    allocation["partial"].append(allocation_result)
+                        allocated_quantity=remaining_stock
+                    ))
+                    counts["partial"] += 1
                     remaining_stock = 0
-                    
-                else:
-                    # Delayed
-                    allocation_result = AllocationResult(
-                        order_id=order_id,
-                        order_type=order_type,
-                        requested_quantity=requested_quantity,
-                        allocated_quantity=0,
-                        status="delayed"
-                    )
-                    allocation["delayed"].append(allocation_result)
         
-        return allocation
+        # Stock exhausted - everything still queued is delayed; collect the ids
+        # in the same pass so callers don't walk the results again
+        delayed_ids = []
+        append_delayed = delayed.append
+        append_delayed_id = delayed_ids.append
+        for order_type, demands in tail:
+            for demand in demands:
+                append_delayed(build_delayed(
+                    order_id=demand.order_id,
+                    order_type=order_type,
+                    requested_quantity=demand.total_quantity
+                ))
+                append_delayed_id(demand.order_id)
+        counts["delayed"] = len(delayed)
+        
+        allocation = {"fulfilled": fulfilled, "partial": partial, "delayed": delayed}
+        return allocation, counts, delayed_ids
     
-    def _filter_material_orders(self, material_id: str, sales_orders_df) -> List[Dict]:
+    def _filter_material_orders(self, material_id: str, sales_orders_df) -> List[SalesOrderRow]:
         """Filter sales orders for the given material."""
         try:
-            material_orders = []
-            
-            for row in sales_orders_df.data:
-                # Check if this order is for our material
-                if row.get('material_id') == material_id:
-                    material_orders.append(row)
+            material_orders = [
+                order for order in sales_orders_df.to_records(SalesOrderRow)
+                if order.material_id == material_id
+            ]
             
-            self.logger.debug(f"Found {len(material_orders)} orders for {material_id}")
+            self.logger.debug("Found %d orders for %s", len(material_orders), material_id)
             return material_orders
             
         except Exception as e:
-            self.logger.error(f"Error filtering orders for {material_id}: {e}")
+            self.logger.error("Error filtering orders for %s: %s", material_id, e)
             return []
     
-    def _group_by_order_type(self, orders: List[Dict]) -> Dict[str, List[Dict]]:
-        """Group orders by order_type."""
-        grouped = {}
-        
-        for order in orders:
-            order_type = order.get('order_type', 'unknown')
-            if order_type not in grouped:
-                grouped[order_type] = []
-            grouped[order_type].append(order)
-        
-        self.logger.debug(f"Grouped orders by type: {list(grouped.keys())}")
-        return grouped
-    
-    def _sort_by_priority(self, grouped_orders: Dict[str, List[Dict]]) -> List[Tuple[str, List[Dict]]]:
-        """Sort order groups by priority rules."""
-        # Sort by priority number (lower = higher priority)
-        sorted_groups = sorted(
-            grouped_orders.items(),
-            key=lambda x: self.PRIORITY_RULES.get(x[0], 999)
-        )
-        
-        self.logger.debug(f"Priority order: {[group_type for group_type, _ in sorted_groups]}")
-        return sorted_groups
-    
-    def _allocate_stock(self, available_stock: int, sorted_groups: List[Tuple[str, List[Dict]]]) -> Dict[str, List[AllocationResult]]:
+    def _allocate_stock(self, available_stock: int, sorted_groups: List[Tuple[str, List[SalesOrderRow]]]) -> Dict[str, List[AllocationResult]]:
         """
         Allocate stock greedily by priority.
         
@@ -292,68 +534,184 @@ class PriorityArbiter:
         Returns:
             Dictionary with "fulfilled", "partial", "delayed" allocation results
         """
-        allocation = {"fulfilled": [], "partial": [], "delayed": []}
+        fulfilled, partial, delayed = [], [], []
+        append_fulfilled = fulfilled.append
+        append_partial = partial.append
         remaining_stock = available_stock
         
-        for order_type, orders in sorted_groups:
+        # Hoisted out of the per-order loop: one builder per status
+        AR = AllocationResult
+        build_fulfilled = functools.partial(AR, status="fulfilled")
+        build_partial = functools.partial(AR, status="partial")
+        build_delayed = functools.partial(AR, allocated_quantity=0, status="delayed")
+        debug = self.logger.debug
+        
+        # Orders left over once stock runs out: (order_type, orders) pairs
+        tail = []
+        
+        for group_index, (order_type, orders) in enumerate(sorted_groups):
+            if remaining_stock <= 0:
+                tail.extend(sorted_groups[group_index:])
+                break
+            
             priority = self.PRIORITY_RULES.get(order_type, 999)
-            self.logger.debug(f"Processing {order_type} orders (priority {priority}), remaining stock: {remaining_stock}")
+            debug("Processing %s orders (priority %d), remaining stock: %d", order_type, priority, remaining_stock)
+            
+            selection = self._select_tier_orders([order.quantity for order in orders], remaining_stock)
+            if selection is not None:
+                # Oversubscribed tier: fill exactly, top up one order, delay the rest
+                skipped = []
+                for order, selected in zip(orders, selection):
+                    if selected:
+                        append_fulfilled(build_fulfilled(
+                            order_id=order.sales_order_id or f'unknown_{len(fulfilled)}',
+                            order_type=order_type,
+                            requested_quantity=order.quantity,
+                            allocated_quantity=order.quantity,
+                            customer_id=order.customer_id
+                        ))
+                        remaining_stock -= order.quantity
+                    else:
+                        skipped.append(order)
+                
+                if remaining_stock > 0:
+                    order = skipped.pop(0)
+                    append_partial(build_partial(
+                        order_id=order.sales_order_id or f'unknown_{len(fulfilled)}',
+                        order_type=order_type,
+                        requested_quantity=order.quantity,
+                        allocated_quantity=remaining_stock,
+                        customer_id=order.customer_id
+                    ))
+                    remaining_stock = 0
+                
+                tail.append((order_type, skipped))
+                continue
             
-            for order in orders:
-                order_id = order.get('order_id', f'unknown_{len(allocation["fulfilled"])}')
-                requested_quantity = int(order.get('quantity', 0))
-                customer_id = order.get('customer_id')
+            for position, order in enumerate(orders):
+                if remaining_stock <= 0:
+                    tail.append((order_type, orders[position:]))
+                    break
+                
+                order_id = order.sales_order_id or f'unknown_{len(fulfilled)}'
+                requested_quantity = order.quantity
                 
                 if remaining_stock >= requested_quantity:
                     # Full fulfillment
-                    allocation_result = AllocationResult(
+                    append_fulfilled(build_fulfilled(
                         order_id=order_id,
                         order_type=order_type,
                         requested_quantity=requested_quantity,
                         allocated_quantity=requested_quantity,
-                        status="fulfilled",
-                        customer_id=customer_id
-                    )
-                    allocation["fulfilled"].append(allocation_result)
+                        customer_id=order.customer_id
+                    ))
                     remaining_stock -= requested_quantity
                     
-                elif remaining_stock > 0:
+                else:
                     # Partial fulfillment
-                    allocation_result = AllocationResult(
+                    append_partial(build_partial(
                         order_id=order_id,
                         order_type=order_type,
                         requested_quantity=requested_quantity,
                         allocated_quantity=remaining_stock,
-                        status="partial",
-                        customer_id=customer_id
-                    )
-                    allocation["partial"].append(allocation_result)
+                        customer_id=order.customer_id
+                    ))
                     remaining_stock = 0
-                    
-                else:
-                    # Delayed
-                    allocation_result = AllocationResult(
-                        order_id=order_id,
-                        order_type=order_type,
-                        requested_quantity=requested_quantity,
-                        allocated_quantity=0,
-                        status="delayed",
-                        customer_id=customer_id
-                    )
-                    allocation["delayed"].append(allocation_result)
         
-        return allocation
+        # Stock exhausted - everything still queued is delayed
+        unknown_id = f'unknown_{len(fulfilled)}'
+        delayed.extend(
+            build_delayed(
+                order_id=order.sales_order_id or unknown_id,
+                order_type=order_type,
+                requested_quantity=order.quantity,
+                customer_id=order.customer_id
+            )
+            for order_type, orders in tail
+            for order in orders
+        )
+        
+        return {"fulfilled": fulfilled, "partial": partial, "delayed": delayed}
     
-    def _generate_summary(self, material_id: str, available_stock: int, total_demand: int, allocation: Dict[str, List[AllocationResult]]) -> str:
-        """Generate short text summary of allocation."""
-        fulfilled_count = len(allocation.get("fulfilled", []))
-        partial_count = len(allocation.get("partial", []))
-        delayed_count = len(allocation.get("delayed", []))
+    def _select_tier_orders(self, quantities: List[int], capacity: int) -> Optional[List[bool]]:
+        """
+        Pick which orders of an oversubscribed tier to fulfill in full.
+        
+        Greedy arrival-order filling can leave most of the stock on one partial
+        order while smaller orders behind it would have fit exactly. This runs a
+        0/1 subset-sum over the tier (reachable totals kept as an int bitset) and
+        returns the selection that fulfills the most quantity in full, preferring
+        earlier orders on ties.
         
-        summary = f"Material {material_id}: {fulfilled_count} fulfilled, {partial_count} partial, {delayed_count} delayed (stock: {available_stock}, demand: {total_demand})"
+        Args:
+            quantities: Requested quantity per order, in arrival order
+            capacity: Remaining stock
+            
+        Returns:
+            One flag per order (True = fulfill in full), or None when the tier fits,
+            is too large for exact packing, or has non-positive quantities (greedy applies)
+        """
+        if len(quantities) > self.KNAPSACK_MAX_ORDERS or capacity > self.KNAPSACK_MAX_STOCK:
+            return None
+        if sum(quantities) <= capacity or min(quantities) <= 0:
+            return None
+        
+        mask = (1 << (capacity + 1)) - 1
+        reachable = 1  # bit t set = total t achievable with the orders seen so far
+        history = []
+        for quantity in quantities:
+            history.append(reachable)
+            reachable = (reachable | (reachable << quantity)) & mask
+        
+        # Walk back from the best total; skip an order whenever the total is
+        # reachable without it, so later orders are the ones left out
+        target = reachable.bit_length() - 1
+        selection = [False] * len(quantities)
+        for index in range(len(quantities) - 1, -1, -1):
+            if not (history[index] >> target) & 1:
+                selection[index] = True
+                target -= quantities[index]
+        
+        return selection
+    
+    def _generate_summary(self, material_id: str, available_stock: int, total_demand: int, counts: Dict[str, int]) -> str:
+        """Generate short text summary of allocation from per-status counts."""
+        summary = f"Material {material_id}: {counts['fulfilled']} fulfilled, {counts['partial']} partial, {counts['delayed']} delayed (stock: {available_stock}, demand: {total_demand})"
         
         return summary
     
+    def explain(self, resolution: PriorityResolution) -> Optional[str]:
+        """
+        Generate the customer explanation for a resolution on request.
+        
+        Arbitration (single or bulk) never calls the LLM; callers that need
+        customer-facing text ask for it here. Generated text is kept per
+        resolution (material, stock and delayed orders), so asking again for
+        the same resolution doesn't repeat the LLM call.
+        
+        Args:
+            resolution: Resolution returned by resolve_conflict / resolve_conflicts_bulk
+            
+        Returns:
+            Explanation text, or None (no LLM client, nothing delayed, or LLM failure)
+        """
+        if resolution.explanation is not None:
+            return resolution.explanation
+        
+        cache_key = (resolution.material, resolution.available_stock, tuple(resolution.delayed_orders))
+        explanation = self._explanation_cache.get(cache_key)
+        if explanation is not None:
+            self._explanation_cache.move_to_end(cache_key)
+            return explanation
+        
+        # Failures (None) aren't kept, so a later call can retry
+        explanation = self._generate_explanation(resolution.allocation)
+        if explanation is not None:
+            self._explanation_cache[cache_key] = explanation
+            if len(self._explanation_cache) > self.RESOLUTION_CACHE_SIZE:
+                self._explanation_cache.popitem(last=False)
+        return explanation
+    
     def _generate_explanation(self, allocation: Dict[str, List[AllocationResult]]) -> Optional[str]:
         """
         Generate customer explanation for delayed orders.
@@ -397,7 +755,7 @@ Keep it concise and customer-friendly."""
                 return explanation
                 
         except Exception as e:
-            self.logger.warning(f"LLM explanation generation failed: {e}")
+            self.logger.warning("LLM explanation generation failed: %s", e)
         
         # Fallback to None (system will use static template)
         return None
@@ -5,23 +5,57 @@ Deterministic-first inventory analysis with LLM explanation.
 Detects overstocking vs understocking risk using statistical analysis.
 """
 
+import csv
+import functools
+import hashlib
 import logging
-import statistics
+import shelve
+import threading
+import time
+from array import array
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 import os
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional here; volatility falls back to pure Python
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:  # pandas is optional here; the CSV loaders fall back to pure Python
+    pd = None
+
+from config.settings import settings
 from utils.helpers import setup_logging
 from services.huggingface_llm import HuggingFaceLLM
-from data.dataset_loader import DatasetLoader
+from data.dataset_loader import DatasetLoader, SalesOrderRow
 from hugo.agents.priority_arbiter import PriorityArbiter, PriorityResolution
 
 logger = setup_logging()
 
 
-@dataclass
+MEMO_PROMPT_TEMPLATE = """Generate a brief manager memo (2-3 sentences) explaining this inventory recommendation:
+
+Material: {material_id}
+Current Stock: {current_stock} units
+Average Daily Demand: {daily_demand:.1f} units
+Days of Cover: {days_of_cover:.1f} days
+Demand Volatility: {volatility:.1f} units
+Confidence: {confidence}
+
+Focus on business impact and action needed. Be concise and professional."""
+
+# Removes both quote characters from LLM output
+_STRIP_QUOTES = str.maketrans('', '', '"\'')
+
+
+@dataclass(slots=True)
 class InventoryRecommendation:
     """Inventory analysis result for a material."""
     material_id: str
@@ -43,16 +77,40 @@ class InventoryBalancer:
     3. LLM only for manager-facing explanations
     """
     
-    def __init__(self, data_dir: str = "hugo_data_samples"):
+    # Concurrent per-material analyses and LLM memo calls
+    ANALYSIS_WORKERS = 8
+    MEMO_WORKERS = 8
+    
+    # LLM memos are persisted across runs for this long (seconds), up to this
+    # many entries (oldest evicted first)
+    MEMO_CACHE_TTL = 7 * 86400
+    MEMO_CACHE_MAX_ENTRIES = 2048
+    
+    # Rows per chunk when reading sales_orders.csv with pandas
+    SALES_CHUNK_ROWS = 200_000
+    
+    # Parsed CSVs shared across instances: (path, days_back) -> ((mtime_ns, size[, cutoff day]), result)
+    _parse_cache: Dict[Tuple[str, Optional[int]], Tuple[tuple, dict]] = {}
+    
+    def __init__(
+        self,
+        data_dir: str = "hugo_data_samples",
+        memo_cache_path: Optional[str] = None,
+        use_memo_cache: Optional[bool] = None
+    ):
         """
         Initialize Inventory Balancer.
         
         Args:
             data_dir: Directory containing CSV files
+            memo_cache_path: LLM memo cache file (default: settings.MEMO_CACHE_PATH,
+                else <data_dir>/.memo_cache)
+            use_memo_cache: Persist LLM memos across runs (default: settings.MEMO_CACHE_ENABLED)
         """
         self.data_dir = Path(data_dir)
         self.sales_orders_file = self.data_dir / "sales_orders.csv"
         self.stock_levels_file = self.data_dir / "stock_levels.csv"
+        self._prefetch_csv_files()
         self.llm = HuggingFaceLLM()
         
         # Calculate the absolute path to 'hugo_data_samples' inside Backend
@@ -63,11 +121,58 @@ class InventoryBalancer:
         self.dataset_loader = DatasetLoader(data_path)
         
         # Initialize Priority Arbiter for conflict resolution
-        self.priority_arbiter = PriorityArbiter(logger=logger, llm_client=self.llm)
+        self.priority_arbiter = PriorityArbiter(logger=logger, llm_client=self.llm, dataset_loader=self.dataset_loader)
+        
+        # On-disk LLM memo cache (opened on first use; shelve is not thread-safe)
+        if use_memo_cache is None:
+            use_memo_cache = settings.MEMO_CACHE_ENABLED
+        self._memo_cache_path = Path(memo_cache_path or settings.MEMO_CACHE_PATH or self.data_dir / ".memo_cache")
+        self._memo_cache = None if use_memo_cache else False
+        self._memo_cache_lock = threading.Lock()
         
         logger.info("InventoryBalancer initialized")
     
-    def load_sales_data(self, days_back: int = 30) -> Dict[str, List[float]]:
+    def close(self) -> None:
+        """Flush and close the on-disk memo cache (safe to call more than once)."""
+        with self._memo_cache_lock:
+            if self._memo_cache is not None and self._memo_cache is not False:
+                try:
+                    self._memo_cache.close()
+                except Exception as e:
+                    logger.debug(f"Failed to close memo cache: {e}")
+                self._memo_cache = None
+    
+    def __enter__(self) -> "InventoryBalancer":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+    
+    def _prefetch_csv_files(self) -> None:
+        """
+        Ask the kernel to start reading the CSVs into the page cache.
+        
+        Readahead overlaps with the rest of initialization, so the first load
+        doesn't wait on a cold disk. No-op where posix_fadvise is unavailable.
+        """
+        if not hasattr(os, 'posix_fadvise'):
+            return
+        
+        for path in (self.sales_orders_file, self.stock_levels_file):
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                # Advice values are not flags - issue them separately
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError as e:
+                logger.debug(f"posix_fadvise failed for {path}: {e}")
+            finally:
+                os.close(fd)
+    
+    def load_sales_data(self, days_back: int = 30) -> Dict[str, Sequence[float]]:
         """
         Load sales orders from the last N days.
         
@@ -75,113 +180,210 @@ class InventoryBalancer:
             days_back: Number of days to look back for sales data
             
         Returns:
-            Dict mapping material_id to list of daily quantities
+            Dict mapping material_id to daily quantities - a float64 numpy array, or
+            array('d') without numpy (cached while the file is unchanged - treat as read-only)
         """
         if not self.sales_orders_file.exists():
             logger.warning(f"Sales orders file not found: {self.sales_orders_file}")
             return {}
         
-        try:
-            with open(self.sales_orders_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            # Skip header
-            if not lines:
-                return {}
-            
-            header = lines[0].strip().split(',')
-            logger.debug(f"Sales orders header: {header}")
-            
-            # Find column indices
+        first_day_str = self._sales_cutoff_day(days_back)
+        
+        # Reuse the parse while the file (and the cutoff day) is unchanged
+        stat = self.sales_orders_file.stat()
+        cache_key = (str(self.sales_orders_file), days_back)
+        stamp = (stat.st_mtime_ns, stat.st_size, first_day_str)
+        cached = self._parse_cache.get(cache_key)
+        if cached is not None and cached[0] == stamp:
+            logger.debug(f"Using cached sales data for {self.sales_orders_file}")
+            return cached[1]
+        
+        daily_sales = self._parse_sales_data(days_back, first_day_str)
+        if np is not None:
+            # Zero-copy float64 views so downstream stats stay vectorized
+            daily_sales = {material_id: np.frombuffer(quantities, dtype=np.float64) for material_id, quantities in daily_sales.items()}
+        if daily_sales:
+            self._parse_cache[cache_key] = (stamp, daily_sales)
+        return daily_sales
+    
+    def _sales_cutoff_day(self, days_back: int) -> str:
+        """
+        First calendar day (YYYY-MM-DD) whose midnight is not before now - days_back.
+        
+        Dates are ISO formatted, so the sales filter is a plain string compare.
+        """
+        cutoff_date = datetime.now() - timedelta(days=days_back)
+        first_day = cutoff_date.date()
+        if cutoff_date.time() != datetime.min.time():
+            first_day += timedelta(days=1)
+        return first_day.isoformat()
+    
+    def _parse_sales_data(self, days_back: int, first_day_str: str) -> Dict[str, array]:
+        """Parse sales_orders.csv, keeping rows requested on or after first_day_str."""
+        if pd is not None:
             try:
-                model_idx = header.index('model')
-                quantity_idx = header.index('quantity')
-                order_date_idx = header.index('requested_date')
-            except ValueError as e:
-                logger.error(f"Missing required columns in sales_orders.csv: {e}")
-                return {}
-            
-            cutoff_date = datetime.now() - timedelta(days=days_back)
-            daily_sales = {}
-            
-            for line in lines[1:]:
+                return self._load_sales_data_pandas(days_back, first_day_str)
+            except Exception as e:
+                logger.debug(f"Vectorized sales load failed, using row parser: {e}")
+        
+        try:
+            with open(self.sales_orders_file, 'r', encoding='utf-8', newline='') as f:
+                reader = csv.reader(f)
+                header = next(reader, None)
+                
+                # Skip header
+                if not header:
+                    return {}
+                
+                logger.debug(f"Sales orders header: {header}")
+                
+                # Find column indices
                 try:
-                    columns = line.strip().split(',')
-                    if len(columns) < max(model_idx, quantity_idx, order_date_idx) + 1:
-                        continue
-                    
-                    material_id = columns[model_idx]
-                    quantity = float(columns[quantity_idx])
-                    order_date_str = columns[order_date_idx]
-                    
-                    # Parse date
+                    model_idx = header.index('model')
+                    quantity_idx = header.index('quantity')
+                    order_date_idx = header.index('requested_date')
+                except ValueError as e:
+                    logger.error(f"Missing required columns in sales_orders.csv: {e}")
+                    return {}
+                
+                # Packed doubles instead of a list of float objects
+                daily_sales = defaultdict(functools.partial(array, 'd'))
+                
+                for columns in reader:
                     try:
-                        order_date = datetime.strptime(order_date_str, '%Y-%m-%d')
-                    except ValueError:
+                        order_date_str = columns[order_date_idx]
+                        
+                        # Only include recent orders
+                        if len(order_date_str) != 10 or order_date_str < first_day_str:
+                            continue
+                        # The string compare assumes a valid ISO date; reject
+                        # anything else (e.g. 2024-13-45, 2024/01/05)
+                        datetime.strptime(order_date_str, '%Y-%m-%d')
+                        
+                        quantity = float(columns[quantity_idx])
+                        material_id = columns[model_idx]
+                    except (ValueError, IndexError) as e:
+                        logger.debug(f"Skipping malformed sales row: {e}")
                         continue
                     
-                    # Only include recent orders
-                    if order_date >= cutoff_date:
-                        if material_id not in daily_sales:
-                            daily_sales[material_id] = []
-                        daily_sales[material_id].append(quantity)
-                
-                except (ValueError, IndexError) as e:
-                    logger.debug(f"Skipping malformed sales row: {e}")
-                    continue
+                    daily_sales[material_id].append(quantity)
             
             logger.info(f"Loaded sales data for {len(daily_sales)} materials (last {days_back} days)")
-            return daily_sales
+            return dict(daily_sales)
             
         except Exception as e:
             logger.error(f"Error loading sales data: {e}")
             return {}
     
+    def _load_sales_data_pandas(self, days_back: int, first_day_str: str) -> Dict[str, array]:
+        """
+        Vectorized variant of load_sales_data (C parser, column-wise date filter).
+        
+        The file is read in SALES_CHUNK_ROWS chunks so memory stays bounded on large
+        histories; chunks with no rows inside the window are dropped after a single
+        string compare, before any date parsing or grouping.
+        
+        Parsing is strict: any malformed value raises so the caller can fall back
+        to the tolerant row-by-row parser.
+        """
+        daily_sales = {}
+        
+        with pd.read_csv(
+            self.sales_orders_file,
+            usecols=['model', 'quantity', 'requested_date'],
+            dtype={'model': str, 'quantity': 'float64', 'requested_date': str},
+            keep_default_na=False,
+            engine='c',
+            chunksize=self.SALES_CHUNK_ROWS
+        ) as chunks:
+            for chunk in chunks:
+                # ISO dates order like strings; only the rows kept need validating
+                requested = chunk['requested_date']
+                recent = chunk[(requested >= first_day_str) & (requested.str.len() == 10)]
+                if recent.empty:
+                    continue
+                pd.to_datetime(recent['requested_date'], format='%Y-%m-%d')
+                
+                for material_id, quantities in recent.groupby('model', sort=False)['quantity']:
+                    packed = daily_sales.get(material_id)
+                    if packed is None:
+                        packed = daily_sales[material_id] = array('d')
+                    packed.frombytes(quantities.to_numpy(dtype='float64').tobytes())
+        
+        logger.info(f"Loaded sales data for {len(daily_sales)} materials (last {days_back} days)")
+        return daily_sales
+    
     def load_stock_levels(self) -> Dict[str, int]:
         """
         Load current stock levels.
         
         Returns:
-            Dict mapping material_id to current stock quantity
+            Dict mapping material_id to current stock quantity (cached while the
+            file is unchanged - treat as read-only)
         """
         if not self.stock_levels_file.exists():
             logger.warning(f"Stock levels file not found: {self.stock_levels_file}")
             return {}
         
-        try:
-            with open(self.stock_levels_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            if not lines:
-                return {}
-            
-            header = lines[0].strip().split(',')
-            logger.debug(f"Stock levels header: {header}")
-            
-            # Find column indices
+        # Reuse the parse while the file is unchanged
+        stat = self.stock_levels_file.stat()
+        cache_key = (str(self.stock_levels_file), None)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._parse_cache.get(cache_key)
+        if cached is not None and cached[0] == stamp:
+            logger.debug(f"Using cached stock levels for {self.stock_levels_file}")
+            return cached[1]
+        
+        stock_levels = self._parse_stock_levels()
+        if stock_levels:
+            self._parse_cache[cache_key] = (stamp, stock_levels)
+        return stock_levels
+    
+    def _parse_stock_levels(self) -> Dict[str, int]:
+        """Parse stock_levels.csv into part_id -> quantity_available."""
+        if pd is not None:
             try:
-                part_id_idx = header.index('part_id')
-                quantity_idx = header.index('quantity_available')
-            except ValueError as e:
-                logger.error(f"Missing required columns in stock_levels.csv: {e}")
-                return {}
-            
-            stock_levels = {}
-            
-            for line in lines[1:]:
+                df = pd.read_csv(
+                    self.stock_levels_file,
+                    usecols=['part_id', 'quantity_available'],
+                    dtype=str,
+                    keep_default_na=False,
+                    engine='c'
+                )
+                # Convert from text: the C parser's int64 reader also takes "7.0", which int() rejects
+                quantities = df['quantity_available'].astype('int64')
+                stock_levels = dict(zip(df['part_id'].tolist(), quantities.tolist()))
+                logger.info(f"Loaded stock levels for {len(stock_levels)} materials")
+                return stock_levels
+            except Exception as e:
+                logger.debug(f"Vectorized stock load failed, using row parser: {e}")
+        
+        try:
+            with open(self.stock_levels_file, 'r', encoding='utf-8', newline='') as f:
+                reader = csv.reader(f)
+                header = next(reader, None)
+                
+                if not header:
+                    return {}
+                
+                logger.debug(f"Stock levels header: {header}")
+                
+                # Find column indices
                 try:
-                    columns = line.strip().split(',')
-                    if len(columns) < max(part_id_idx, quantity_idx) + 1:
-                        continue
-                    
-                    material_id = columns[part_id_idx]
-                    quantity = int(columns[quantity_idx])
-                    
-                    stock_levels[material_id] = quantity
+                    part_id_idx = header.index('part_id')
+                    quantity_idx = header.index('quantity_available')
+                except ValueError as e:
+                    logger.error(f"Missing required columns in stock_levels.csv: {e}")
+                    return {}
                 
-                except (ValueError, IndexError) as e:
-                    logger.debug(f"Skipping malformed stock row: {e}")
-                    continue
+                stock_levels = {}
+                
+                for columns in reader:
+                    try:
+                        stock_levels[columns[part_id_idx]] = int(columns[quantity_idx])
+                    except (ValueError, IndexError) as e:
+                        logger.debug(f"Skipping malformed stock row: {e}")
+                        continue
             
             logger.info(f"Loaded stock levels for {len(stock_levels)} materials")
             return stock_levels
@@ -190,25 +392,34 @@ class InventoryBalancer:
             logger.error(f"Error loading stock levels: {e}")
             return {}
     
-    def calculate_demand_statistics(self, daily_quantities: List[float]) -> Tuple[float, float]:
+    def calculate_demand_statistics(self, daily_quantities: Sequence[float]) -> Tuple[float, float]:
         """
         Calculate average daily demand and volatility.
         
         Args:
-            daily_quantities: List of daily demand quantities
+            daily_quantities: Daily demand quantities (list, array or numpy array)
             
         Returns:
             Tuple of (avg_daily_demand, volatility_std)
         """
-        if not daily_quantities:
+        if len(daily_quantities) == 0:
             return 0.0, 0.0
         
-        avg_demand = statistics.mean(daily_quantities)
+        count = len(daily_quantities)
         
-        if len(daily_quantities) == 1:
+        # numpy's call overhead only pays off beyond a handful of values (or if
+        # the data is already an ndarray)
+        if np is not None and (count >= 8 or isinstance(daily_quantities, np.ndarray)):
+            quantities = np.asarray(daily_quantities, dtype=np.float64)
+            return float(quantities.mean()), float(quantities.std(ddof=1)) if count > 1 else 0.0
+        
+        # Plain float arithmetic (statistics.* uses exact Fraction math we don't need)
+        avg_demand = sum(daily_quantities) / count
+        
+        if count == 1:
             volatility = 0.0
         else:
-            volatility = statistics.stdev(daily_quantities)
+            volatility = (sum((q - avg_demand) * (q - avg_demand) for q in daily_quantities) / (count - 1)) ** 0.5
         
         return avg_demand, volatility
     
@@ -264,30 +475,87 @@ class InventoryBalancer:
         Returns:
             Manager memo string
         """
-        memo_prompt = f"""Generate a brief manager memo (2-3 sentences) explaining this inventory recommendation:
+        memo_prompt = MEMO_PROMPT_TEMPLATE.format(
+            material_id=material_id,
+            current_stock=current_stock,
+            daily_demand=daily_demand,
+            days_of_cover=days_of_cover,
+            volatility=volatility,
+            confidence=confidence
+        )
 
-Material: {material_id}
-Current Stock: {current_stock} units
-Average Daily Demand: {daily_demand:.1f} units
-Days of Cover: {days_of_cover:.1f} days
-Demand Volatility: {volatility:.1f} units
-Confidence: {confidence}
-
-Focus on business impact and action needed. Be concise and professional."""
+        # Inventory moves slowly, so the same rounded inputs recur across runs
+        cache_key = hashlib.blake2b(
+            f"{material_id}|{current_stock}|{daily_demand:.1f}|{days_of_cover:.0f}|{volatility:.1f}|{confidence}".encode(),
+            digest_size=16
+        ).hexdigest()
+        cached_memo = self._get_cached_memo(cache_key)
+        if cached_memo is not None:
+            return cached_memo
 
         try:
             response = self.llm.generate(memo_prompt)
             if response and len(response.strip()) > 10:
-                memo = response.strip()
-                # Clean up common LLM artifacts
-                memo = memo.replace('"', '').replace("'", "")
+                # Clean up common LLM artifacts (quotes stripped in one pass)
+                memo = response.strip().translate(_STRIP_QUOTES)
                 if len(memo) > 200:
                     memo = memo[:200] + "..."
+                self._store_cached_memo(cache_key, memo)
                 return memo
         except Exception as e:
             logger.warning(f"LLM memo generation failed for {material_id}: {e}")
         
-        # Deterministic fallback based on analysis context
+        return self._fallback_memo(material_id, current_stock, daily_demand, days_of_cover)
+    
+    def _open_memo_cache(self):
+        """Open the on-disk memo cache, dropping expired entries. Returns None if unavailable."""
+        if self._memo_cache is None:
+            try:
+                cache = shelve.open(str(self._memo_cache_path))
+                now = time.time()
+                for key in [key for key, (stored_at, _) in cache.items() if now - stored_at >= self.MEMO_CACHE_TTL]:
+                    del cache[key]
+                self._memo_cache = cache
+            except Exception as e:
+                logger.debug(f"Memo cache unavailable at {self._memo_cache_path}: {e}")
+                self._memo_cache = False
+        return self._memo_cache if self._memo_cache is not False else None
+    
+    def _get_cached_memo(self, cache_key: str) -> Optional[str]:
+        """Return a cached LLM memo if one was stored within MEMO_CACHE_TTL."""
+        with self._memo_cache_lock:
+            cache = self._open_memo_cache()
+            if cache is None:
+                return None
+            entry = cache.get(cache_key)
+        
+        if entry is None or time.time() - entry[0] >= self.MEMO_CACHE_TTL:
+            return None
+        return entry[1]
+    
+    def _store_cached_memo(self, cache_key: str, memo: str) -> None:
+        """Persist an LLM memo (deterministic fallbacks are not cached)."""
+        with self._memo_cache_lock:
+            cache = self._open_memo_cache()
+            if cache is None:
+                return
+            try:
+                cache[cache_key] = (time.time(), memo)
+                if len(cache) > self.MEMO_CACHE_MAX_ENTRIES:
+                    self._evict_oldest_memos(cache)
+                cache.sync()
+            except Exception as e:
+                logger.debug(f"Failed to store memo in cache: {e}")
+    
+    def _evict_oldest_memos(self, cache) -> None:
+        """Trim the memo cache to 3/4 of MEMO_CACHE_MAX_ENTRIES, oldest first (amortizes the scan)."""
+        keep = self.MEMO_CACHE_MAX_ENTRIES * 3 // 4
+        by_age = sorted(cache.keys(), key=lambda key: cache[key][0])
+        for key in by_age[:len(by_age) - keep]:
+            del cache[key]
+    
+    def _fallback_memo(self, material_id: str, current_stock: int, daily_demand: float, days_of_cover: float) -> str:
+        """Deterministic manager memo used when the LLM is skipped or fails."""
         if daily_demand == 0:
             return f"No recent sales data for {material_id}. Current stock of {current_stock} units should be reviewed."
         elif days_of_cover > 90:
@@ -297,6 +565,29 @@ Focus on business impact and action needed. Be concise and professional."""
         else:
             return f"Inventory level for {material_id} appears appropriate with {days_of_cover:.0f} days of cover based on current demand patterns."
     
+    def _generate_manager_memos(self, memo_requests: List[Dict]) -> List[str]:
+        """
+        Generate manager memos for several materials concurrently.
+        
+        Each LLM call is a network round-trip, so the calls are overlapped on a
+        thread pool instead of being made one after another.
+        
+        Args:
+            memo_requests: generate_manager_memo keyword arguments, one dict per material
+            
+        Returns:
+            Memos in the same order as memo_requests
+        """
+        if not memo_requests:
+            return []
+        
+        if len(memo_requests) == 1:
+            return [self.generate_manager_memo(**memo_requests[0])]
+        
+        workers = min(self.MEMO_WORKERS, len(memo_requests))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda kwargs: self.generate_manager_memo(**kwargs), memo_requests))
+    
     def _calculate_demand_volatility(self, material_id: str) -> float:
         """
         Calculate demand volatility for confidence scoring.
@@ -326,7 +617,10 @@ Focus on business impact and action needed. Be concise and professional."""
             if len(daily_quantities) < 2:
                 return 0.0
             
-            # Calculate standard deviation
+            # Population standard deviation (mean and sum of squares in one C pass)
+            if np is not None:
+                return float(np.asarray(daily_quantities, dtype=np.float64).std())
+            
             mean_demand = sum(daily_quantities) / len(daily_quantities)
             variance = sum((q - mean_demand) ** 2 for q in daily_quantities) / len(daily_quantities)
             volatility = variance ** 0.5  # Standard deviation
@@ -349,38 +643,27 @@ Focus on business impact and action needed. Be concise and professional."""
         """
         conflicts = []
         
+        # Get all sales orders (not filtered by material_id)
+        all_sales_data = self.dataset_loader.sales_orders
+        
+        if not all_sales_data or all_sales_data.empty():
+            logger.debug("No priority conflicts detected")
+            return conflicts
+        
+        # Part-level demand for every part in one pass over the orders (part_id -> units)
+        try:
+            part_demand = self._calculate_part_demand_index(all_sales_data)
+        except Exception as e:
+            logger.error(f"Error building part demand index: {e}")
+            return conflicts
+        
         for recommendation in recommendations:
             try:
-                # Get current stock
-                stock_info = self.dataset_loader.get_current_stock(recommendation.material_id)
-                current_stock = stock_info.get('quantity_available', 0) if stock_info else 0
-                
-                # Get all sales orders (not filtered by material_id)
-                all_sales_data = self.dataset_loader.sales_orders
-                
-                if not all_sales_data or all_sales_data.empty():
-                    continue
+                # Stock was already looked up by analyze_inventory
+                current_stock = recommendation.current_stock
                 
-                # Calculate part-level demand using BOM
-                total_part_demand = 0
-                has_demand = False
-                
-                for sales_order in all_sales_data.data:
-                    model = sales_order.get('model')
-                    version = sales_order.get('version')
-                    order_quantity = int(sales_order.get('quantity', 0))
-                    
-                    # Get BOM mapping for this model/version
-                    bom_entries = self.dataset_loader.get_bom_mapping(model, version)
-                    
-                    # Check if this part is in the BOM
-                    for bom_entry in bom_entries:
-                        if bom_entry.get('part_id') == recommendation.material_id:
-                            qty_per_unit = int(bom_entry.get('qty_per_unit', 1))
-                            part_demand = order_quantity * qty_per_unit
-                            total_part_demand += part_demand
-                            has_demand = True
-                            break
+                has_demand = recommendation.material_id in part_demand
+                total_part_demand = part_demand.get(recommendation.material_id, 0)
                 
                 # Check if part-level demand exceeds available stock
                 if has_demand and total_part_demand > current_stock:
@@ -406,6 +689,32 @@ Focus on business impact and action needed. Be concise and professional."""
         
         return conflicts
     
+    def _calculate_part_demand_index(self, sales_orders) -> Dict[str, int]:
+        """
+        Expand every sales order through its BOM and total the demand per part.
+        
+        Args:
+            sales_orders: Sales orders SimpleDataFrame
+            
+        Returns:
+            Dict mapping part_id to total part-level demand (parts that appear in
+            any ordered BOM are present, even with zero demand)
+        """
+        # BOM index is built once by the loader; bind the lookups used per order
+        bom_parts_for = self.dataset_loader.get_bom_part_quantities().get
+        part_demand: Dict[str, int] = {}
+        current_demand = part_demand.get
+        
+        for order in sales_orders.to_records(SalesOrderRow):
+            parts = bom_parts_for((order.model, order.version))
+            if not parts:
+                continue
+            quantity = order.quantity
+            for part_id, qty_per_unit in parts.items():
+                part_demand[part_id] = current_demand(part_id, 0) + quantity * qty_per_unit
+        
+        return part_demand
+    
     def analyze_inventory(self) -> List[InventoryRecommendation]:
         """
         Perform complete inventory analysis.
@@ -416,59 +725,109 @@ Focus on business impact and action needed. Be concise and professional."""
         logger.info("Starting inventory analysis...")
         
         # Load data using dataset loader (for proper time windows and mapping)
+        # Process each material with proper mapping; materials are independent,
+        # so the deterministic pass runs on a thread pool (results keep input order)
+        all_materials = self.dataset_loader.get_all_materials()
+        
+        workers = min(self.ANALYSIS_WORKERS, len(all_materials))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(self._analyze_material, all_materials))
+        else:
+            results = [self._analyze_material(material_id) for material_id in all_materials]
+        
         recommendations = []
         
-        # Process each material with proper mapping
-        all_materials = self.dataset_loader.get_all_materials()
+        # Recommendations still waiting for an LLM memo, with the matching memo arguments
+        memo_targets: List[InventoryRecommendation] = []
+        memo_requests: List[Dict] = []
         
-        for material_id in all_materials:
-            try:
-                # Get current stock using dataset loader
-                stock_info = self.dataset_loader.get_current_stock(material_id)
-                current_stock = stock_info.get('quantity_available', 0) if stock_info else 0
-                
-                # Calculate average daily demand using dataset loader
-                avg_daily_demand = self.dataset_loader.calculate_avg_daily_demand(material_id)
-                
-                # Compute volatility for confidence scoring
-                volatility = self._calculate_demand_volatility(material_id)
-                
-                # Apply deterministic rules
-                recommendation, confidence = self.determine_recommendation(avg_daily_demand, volatility)
-                
-                # Generate manager memo
-                days_of_cover = current_stock / avg_daily_demand if avg_daily_demand > 0 else 999
-                memo = self.generate_manager_memo(
-                    material_id=material_id,
-                    current_stock=current_stock,
-                    daily_demand=avg_daily_demand,
-                    days_of_cover=days_of_cover,
-                    volatility=volatility,
-                    confidence=confidence
-                )
-                
-                # Create recommendation
-                inv_rec = InventoryRecommendation(
-                    material_id=material_id,
-                    avg_daily_demand=avg_daily_demand,
-                    volatility=volatility,
-                    current_stock=current_stock,
-                    recommendation=recommendation,
-                    confidence=confidence,
-                    manager_memo=memo
-                )
-                
-                recommendations.append(inv_rec)
-                
-                logger.info(f"Analyzed {material_id}: {recommendation} ({confidence})")
-                
-            except Exception as e:
-                logger.error(f"Error analyzing {material_id}: {e}")
+        for result in results:
+            if result is None:
                 continue
+            inv_rec, memo_request = result
+            recommendations.append(inv_rec)
+            if memo_request is not None:
+                memo_targets.append(inv_rec)
+                memo_requests.append(memo_request)
+        
+        # Generate manager memos in one concurrent batch
+        for inv_rec, memo in zip(memo_targets, self._generate_manager_memos(memo_requests)):
+            inv_rec.manager_memo = memo
         
         logger.info(f"Generated {len(recommendations)} inventory recommendations")
         return recommendations
     
+    def _analyze_material(self, material_id: str) -> Optional[Tuple[InventoryRecommendation, Optional[Dict]]]:
+        """
+        Run the deterministic analysis for one material.
+        
+        Args:
+            material_id: Material identifier
+            
+        Returns:
+            Tuple of (recommendation, generate_manager_memo kwargs or None when the
+            memo is already filled in), or None if the material could not be analyzed
+        """
+        try:
+            # Get current stock using dataset loader
+            stock_info = self.dataset_loader.get_current_stock(material_id)
+            current_stock = stock_info.get('quantity_available', 0) if stock_info else 0
+            
+            # Calculate average daily demand using dataset loader
+            avg_daily_demand = self.dataset_loader.calculate_avg_daily_demand(material_id)
+            
+            if avg_daily_demand == 0:
+                # Dormant material: rules give KEEP_STOCK/LOW and the memo is the
+                # deterministic "no recent sales" text, so skip volatility and the LLM
+                logger.info(f"Analyzed {material_id}: KEEP_STOCK (LOW) - no recent demand")
+                return InventoryRecommendation(
+                    material_id=material_id,
+                    avg_daily_demand=0.0,
+                    volatility=0.0,
+                    current_stock=current_stock,
+                    recommendation="KEEP_STOCK",
+                    confidence="LOW",
+                    manager_memo=self._fallback_memo(material_id, current_stock, 0.0, 999)
+                ), None
+            
+            # Compute volatility for confidence scoring
+            volatility = self._calculate_demand_volatility(material_id)
+            
+            # Apply deterministic rules
+            recommendation, confidence = self.determine_recommendation(avg_daily_demand, volatility)
+            
+            # Create recommendation (memo is filled in by the caller unless decided here)
+            inv_rec = InventoryRecommendation(
+                material_id=material_id,
+                avg_daily_demand=avg_daily_demand,
+                volatility=volatility,
+                current_stock=current_stock,
+                recommendation=recommendation,
+                confidence=confidence
+            )
+            
+            logger.info(f"Analyzed {material_id}: {recommendation} ({confidence})")
+            
+            days_of_cover = current_stock / avg_daily_demand if avg_daily_demand > 0 else 999
+            if recommendation == "KEEP_STOCK" and confidence == "HIGH":
+                # Nothing to act on - the deterministic memo is enough
+                inv_rec.manager_memo = self._fallback_memo(material_id, current_stock, avg_daily_demand, days_of_cover)
+                return inv_rec, None
+            
+            return inv_rec, {
+                "material_id": material_id,
+                "current_stock": current_stock,
+                "daily_demand": avg_daily_demand,
+                "days_of_cover": days_of_cover,
+                "volatility": volatility,
+                "confidence": confidence
+            }
+            
+        except Exception as e:
+            logger.error(f"Error analyzing {material_id}: {e}")
+            return None
+    
     def print_priority_wars_summary(self, conflicts: List[PriorityResolution]) -> None:
         """
         Print CLI summary of priority wars resolution.
@@ -534,10 +893,8 @@ Focus on business impact and action needed. Be concise and professional."""
             return
         
         # Group by recommendation type
-        by_type = {}
+        by_type = defaultdict(list)
         for rec in recommendations:
-            if rec.recommendation not in by_type:
-                by_type[rec.recommendation] = []
             by_type[rec.recommendation].append(rec)
         
         # Print high-priority recommendations first
@@ -551,7 +908,8 @@ Focus on business impact and action needed. Be concise and professional."""
                 
                 # Show top 3 items of each type
                 for rec in recs[:3]:
-                    vol_level = "High" if rec.volatility > rec.avg_daily_demand * 0.5 else "Medium" if rec.volatility > rec.avg_daily_demand * 0.2 else "Low"
+                    vol_ratio = rec.volatility / rec.avg_daily_demand if rec.avg_daily_demand > 0 else 0.0
+                    vol_level = "High" if vol_ratio > 0.5 else "Medium" if vol_ratio > 0.2 else "Low"
                     print(f"  Material: {rec.material_id}")
                     print(f"  Current Stock: {rec.current_stock} units")
                     print(f"  Daily Demand: {rec.avg_daily_demand:.1f} units")
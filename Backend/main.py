@@ -9,29 +9,29 @@ Designed for Streamlit-compatible async operation.
 """
 
 import asyncio
+import functools
 import os
-import requests
 import re
+import sys
+import threading
+import time
 from datetime import datetime
-from typing import Optional
+from types import MappingProxyType
+from typing import Iterator, Optional
 from concurrent.futures import ThreadPoolExecutor
 
 from config.settings import settings
-from models.schemas import Email, DeliveryChange, PurchaseOrder, AlertResult
-from services.email_ingestion import EmailIngestionService
-from services.delivery_detector import DeliveryDetector
-from services.erp_matcher import ERPMatcher
-from services.vector_store import VectorStore
-from services.risk_engine import RiskEngine
-from services.huggingface_llm import HuggingFaceLLM
-from utils.helpers import setup_logging
+from models.schemas import Email, DeliveryChange, PurchaseOrder, AlertResult, Signal, HistoricalContext
+from utils.helpers import setup_logging, change_type_label
 from enum import Enum
-from inventory_balancer import InventoryBalancer
-from data.dataset_loader import DatasetLoader
-from analytics.hoarding_detector import HoardingDetector
 
 logger = setup_logging()
 
+# Console section separators
+BAR = "=" * 60
+DASH = "-" * 40
+THIN = "─" * 50
+
 
 class AlertSeverity(str, Enum):
     """Alert severity levels."""
@@ -46,22 +46,30 @@ def check_llm_provider_status() -> dict:
     """
     Check LLM provider configuration and availability.
     
+    The status is memoized per token availability, so repeated agent
+    construction neither rebuilds nor re-logs it, while setting or clearing
+    HF_TOKEN at runtime is still picked up.
+    
     Returns:
-        dict with 'provider', 'available', and 'model' keys
+        dict with 'provider', 'available', and 'model' keys (a fresh copy;
+        mutating it does not affect the memoized status)
     """
     # Use Hugging Face as the LLM provider
-    hf_token = os.environ.get("HF_TOKEN")
-    model = "google/flan-t5-large"
-    
-    available = hf_token is not None and hf_token != ""
+    return dict(_llm_provider_status(bool(os.environ.get("HF_TOKEN"))))
+
+
+@functools.lru_cache(maxsize=2)
+def _llm_provider_status(available: bool) -> MappingProxyType:
+    """Build (and log) the provider status for a given token availability (read-only)."""
+    model = settings.EXTRACTION_MODEL
     
     logger.info(f"LLM Provider: Hugging Face (model: {model}, available: {available})")
     
-    return {
+    return MappingProxyType({
         "provider": "huggingface",
         "available": available,
         "model": model
-    }
+    })
 
 
 def extract_valid_po_reference(subject: str, body: str) -> Optional[str]:
@@ -188,19 +196,29 @@ def calculate_risk_score(change: DeliveryChange, unmapped: bool = False) -> floa
     Returns:
         Risk score between 0.0 and 1.0
     """
+    return _risk_score(change.delay_days, change.quantity_change, change.confidence, unmapped)
+
+
+def _risk_score(
+    delay_days: Optional[int],
+    quantity_change: Optional[int],
+    confidence: float,
+    unmapped: bool
+) -> float:
+    """Risk score from the primitive DeliveryChange fields (see calculate_risk_score)."""
     base_score = 0.0
     
     # Signal-based risk factors
-    if change.delay_days and change.delay_days > 0:
-        if change.delay_days >= 7:
+    if delay_days and delay_days > 0:
+        if delay_days >= 7:
             base_score += 0.4
-        elif change.delay_days >= 3:
+        elif delay_days >= 3:
             base_score += 0.3
         else:
             base_score += 0.2
     
-    if change.quantity_change and change.quantity_change < 0:
-        abs_change = abs(change.quantity_change)
+    if quantity_change and quantity_change < 0:
+        abs_change = abs(quantity_change)
         if abs_change >= 20:
             base_score += 0.3
         elif abs_change >= 10:
@@ -209,9 +227,9 @@ def calculate_risk_score(change: DeliveryChange, unmapped: bool = False) -> floa
             base_score += 0.1
     
     # Confidence factor
-    if change.confidence >= 0.8:
+    if confidence >= 0.8:
         base_score += 0.2
-    elif change.confidence >= 0.6:
+    elif confidence >= 0.6:
         base_score += 0.1
     
     # Unmapped supplier penalty (but cap at MEDIUM)
@@ -236,7 +254,46 @@ def get_alert_severity(change: DeliveryChange, unmapped: bool = False) -> AlertS
     if unmapped:
         return AlertSeverity.INFO
     
-    risk_score = calculate_risk_score(change, unmapped)
+    return _severity_for(change.delay_days, change.quantity_change, change.confidence)
+
+
+def classify_alert(
+    change: DeliveryChange,
+    po_reference: Optional[str],
+    unmapped: bool = False
+) -> tuple[bool, Optional[AlertSeverity]]:
+    """
+    Gate and grade a delivery change in one pass.
+    
+    Equivalent to should_generate_alert followed by get_alert_severity, but
+    reads each DeliveryChange field once.
+    
+    Args:
+        change: DeliveryChange object
+        po_reference: Valid PO reference or None
+        unmapped: Whether the supplier is not in ERP
+        
+    Returns:
+        Tuple of (should alert, severity or None when gated)
+    """
+    # No valid PO or no signal → no alert; any detected change passes the gate
+    if not po_reference or not change.detected:
+        return False, None
+    
+    if unmapped:
+        return True, AlertSeverity.INFO
+    
+    return True, _severity_for(change.delay_days, change.quantity_change, change.confidence)
+
+
+@functools.lru_cache(maxsize=1024)
+def _severity_for(
+    delay_days: Optional[int],
+    quantity_change: Optional[int],
+    confidence: float
+) -> AlertSeverity:
+    """Severity of a mapped-supplier change; inputs are low-cardinality so results are memoized."""
+    risk_score = _risk_score(delay_days, quantity_change, confidence, False)
     
     if risk_score >= 0.7:
         return AlertSeverity.CRITICAL
@@ -275,16 +332,22 @@ class HugoAgent:
         # Check LLM provider availability at startup
         self.llm_provider = check_llm_provider_status()
         
-        self.email_service = EmailIngestionService()
-        self.detector = DeliveryDetector()
-        self.erp = ERPMatcher()
-        self.vector_store = VectorStore()
-        self.risk_engine = RiskEngine()
-        self.inventory_balancer = InventoryBalancer()
+        # Services are built lazily on first use (see the properties below)
+        self._erp_cache: dict[str, Optional[PurchaseOrder]] = {}
+        self._detector = None
+        self._detector_lock = threading.Lock()
+        
+        # Shared worker pool for the per-email pipelines (LLM/ERP/RAG bound)
+        self._pool = ThreadPoolExecutor(
+            max_workers=settings.MAX_PIPELINE_WORKERS or 8,
+            thread_name_prefix="hugo-pipeline"
+        )
+        
+        # Load the hosted model in the background so the first email skips the cold
+        # start; a daemon thread, so the wait never holds a pipeline worker
+        if self.llm_provider["available"] and settings.HF_WARMUP:
+            threading.Thread(target=self._warm_up_llm, name="hugo-llm-warmup", daemon=True).start()
         
-        # Initialize hoarding detection with simulation mode
-        self.dataset_loader = DatasetLoader()
-        self.hoarding_detector = HoardingDetector(self.dataset_loader)
         self.simulation_mode = simulation_mode
         
         if simulation_mode:
@@ -293,6 +356,76 @@ class HugoAgent:
             logger.info("Running in REAL-TIME MODE")
         
         logger.info("Hugo Agent ready")
+
+    def close(self) -> None:
+        """Stop the pipeline worker pool and release services that hold files open."""
+        self._pool.shutdown(wait=False)
+        # Only close what was actually built; touching the property would construct it
+        if "inventory_balancer" in self.__dict__:
+            self.inventory_balancer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # Service imports and construction are deferred so importing main (e.g. for
+    # the gating helpers in the Streamlit app) and building the agent don't pull
+    # in the Gmail/HF/pandas stacks until a pipeline actually needs them
+    
+    @functools.cached_property
+    def email_service(self):
+        from services.email_ingestion import EmailIngestionService
+        return EmailIngestionService()
+    
+    @property
+    def detector(self):
+        # Also built from the warm-up thread; the lock keeps it to one instance
+        with self._detector_lock:
+            if self._detector is None:
+                from services.delivery_detector import DeliveryDetector
+                self._detector = DeliveryDetector()
+            return self._detector
+    
+    @functools.cached_property
+    def erp(self):
+        from services.erp_matcher import ERPMatcher
+        return ERPMatcher()
+    
+    @functools.cached_property
+    def vector_store(self):
+        from services.vector_store import VectorStore
+        return VectorStore()
+    
+    @functools.cached_property
+    def risk_engine(self):
+        from services.risk_engine import RiskEngine
+        return RiskEngine()
+    
+    @functools.cached_property
+    def inventory_balancer(self):
+        from inventory_balancer import InventoryBalancer
+        return InventoryBalancer()
+    
+    @functools.cached_property
+    def dataset_loader(self):
+        from data.dataset_loader import DatasetLoader
+        return DatasetLoader()
+    
+    @functools.cached_property
+    def hoarding_detector(self):
+        from analytics.hoarding_detector import HoardingDetector
+        return HoardingDetector(self.dataset_loader)
+    
+    def _ensure_services(self) -> None:
+        """Build the lazy services the per-email pipeline uses, before it fans out to worker threads."""
+        for name in ("erp", "vector_store", "detector", "risk_engine"):
+            getattr(self, name)
+    
+    def _warm_up_llm(self) -> None:
+        """Ping the extraction model once through the detector's own client (runs on a daemon thread at startup)."""
+        self.detector.signal_extractor.llm.warm_up()
     
     def process_emails(
         self,
@@ -310,27 +443,46 @@ class HugoAgent:
             List of AlertResult for emails with detected changes
         """
         logger.info(f"Starting email processing (max: {max_emails})")
-        alerts = []
         
         # Metrics tracking
-        metrics = {
-            "emails_processed": 0,
-            "relevant_emails": 0,
-            "signals_detected": 0,
-            "alerts_generated": 0,
-            "false_positives_prevented": 0,
-            "high_risk_alerts": 0
-        }
+        metrics = self._new_metrics()
+        
+        alerts = list(self.iter_alerts(query, max_emails, metrics))
+        
+        if metrics["emails_processed"]:
+            logger.info(f"Generated {len(alerts)} alerts from {metrics['emails_processed']} emails")
+        self._print_metrics_summary(metrics)
+        return alerts
+    
+    def iter_alerts(
+        self,
+        query: Optional[str] = None,
+        max_emails: int = 10,
+        metrics: Optional[dict] = None
+    ) -> Iterator[AlertResult]:
+        """
+        Run the pipeline and yield alerts in fetch order as they complete.
+        
+        Args:
+            query: Optional Gmail search query
+            max_emails: Maximum emails to process
+            metrics: Optional metrics dict (see _new_metrics) updated in place
+        
+        Yields:
+            AlertResult for each email that passes the alert rules
+        """
+        if metrics is None:
+            metrics = self._new_metrics()
         
         # Step 1: Fetch emails
         emails = self.email_service.fetch_emails(query=query, max_results=max_emails)
         logger.info(f"Fetched {len(emails)} emails")
         
         if not emails:
-            self._print_metrics_summary(metrics)
-            return alerts
+            return
         
-        # Step 2-6: Process each email
+        # Step 2-3: Filter emails and extract PO references (cheap, serial)
+        candidates = []
         for email in emails:
             metrics["emails_processed"] += 1
             
@@ -348,10 +500,50 @@ class HugoAgent:
                 continue
             
             metrics["relevant_emails"] += 1
-            
-            # Step 4: Process email for delivery changes
-            alert = self._process_single_email(email, po_reference)
-            
+            candidates.append((email, po_reference))
+        
+        # Step 4: Process relevant emails concurrently (each pipeline is independent)
+        # Build the lazily created services here, not racing in worker threads
+        self._ensure_services()
+        
+        relevant = [email for email, _ in candidates]
+        
+        # PO match + historical context once per (sender, PO) within this batch
+        keys = [(email.sender, po_reference or "") for email, po_reference in candidates]
+        unique_emails = {}
+        for key, email in zip(keys, relevant):
+            unique_emails.setdefault(key, email)
+        context_cache = dict(zip(
+            unique_emails,
+            self._pool.map(self._try_prepare_email_context, unique_emails.values())
+        ))
+        prepared = [context_cache[key] for key in keys]
+        
+        # Signals share batched LLM calls (chunks run concurrently). Emails whose
+        # context failed are re-run (and reported) individually, so they stay out
+        # of the batch
+        ready = [pos for pos, ctx in enumerate(prepared) if ctx]
+        detections = [None] * len(candidates)
+        if ready:
+            batch = self.detector.detect_changes_batch(
+                [relevant[pos] for pos in ready],
+                [prepared[pos][0] for pos in ready],
+                [prepared[pos][2] for pos in ready],
+                executor=self._pool
+            )
+            for pos, detection in zip(ready, batch):
+                detections[pos] = detection
+        
+        processed_at = datetime.utcnow()
+        results = self._pool.map(
+            lambda item: self._process_single_email(
+                *item[0], prepared=item[1], detection=item[2], processed_at=processed_at
+            ),
+            zip(candidates, prepared, detections)
+        )
+        
+        # Step 5-6: Gate alerts and collect metrics in fetch order
+        for (email, po_reference), alert in zip(candidates, results):
             if alert:
                 change = alert.delivery_change
                 
@@ -360,51 +552,120 @@ class HugoAgent:
                 
                 # Step 5: Check if alert should be generated (with PO validation)
                 is_unmapped = alert.alert_source == "unmapped_supplier"
-                if should_generate_alert(change, po_reference, unmapped=is_unmapped):
-                    alerts.append(alert)
+                should_alert, severity = classify_alert(change, po_reference, unmapped=is_unmapped)
+                if should_alert:
                     metrics["alerts_generated"] += 1
                     
                     # Track high-risk alerts
-                    severity = get_alert_severity(change, unmapped=is_unmapped)
-                    if severity == AlertSeverity.CRITICAL:
+                    if severity is AlertSeverity.CRITICAL:
                         metrics["high_risk_alerts"] += 1
+                    yield alert
                 else:
                     # Alert was gated out
                     metrics["false_positives_prevented"] += 1
                     logger.debug(f"Alert gated: {email.subject[:40]}...")
-        
-        logger.info(f"Generated {len(alerts)} alerts from {len(emails)} emails")
-        self._print_metrics_summary(metrics)
-        return alerts
+    
+    @staticmethod
+    def _new_metrics() -> dict:
+        """Return a zeroed processing-metrics dict."""
+        return {
+            "emails_processed": 0,
+            "relevant_emails": 0,
+            "signals_detected": 0,
+            "alerts_generated": 0,
+            "false_positives_prevented": 0,
+            "high_risk_alerts": 0
+        }
     
     def _print_metrics_summary(self, metrics: dict) -> None:
         """
         Print a clean metrics summary at the end of execution.
         
+        Headless runs (Streamlit server, cron) get a single log line instead
+        unless VERBOSE_CONSOLE is set.
+        
         Args:
             metrics: Dictionary with metrics data
         """
-        print("\n" + "="*60)
-        print("PROCESSING METRICS SUMMARY")
-        print("="*60)
-        print(f"Emails Processed:        {metrics['emails_processed']}")
-        print(f"Relevant Emails:         {metrics['relevant_emails']}")
-        print(f"Signals Detected:        {metrics['signals_detected']}")
-        print(f"Alerts Generated:        {metrics['alerts_generated']}")
-        print(f"False Positives Prevented:{metrics['false_positives_prevented']}")
-        print(f"High-Risk Alerts:         {metrics['high_risk_alerts']}")
+        if not settings.VERBOSE_CONSOLE and not sys.stdout.isatty():
+            logger.info(f"Processing metrics: {metrics}")
+            return
+        
+        lines = [
+            "\n" + BAR,
+            "PROCESSING METRICS SUMMARY",
+            BAR,
+            f"Emails Processed:        {metrics['emails_processed']}",
+            f"Relevant Emails:         {metrics['relevant_emails']}",
+            f"Signals Detected:        {metrics['signals_detected']}",
+            f"Alerts Generated:        {metrics['alerts_generated']}",
+            f"False Positives Prevented:{metrics['false_positives_prevented']}",
+            f"High-Risk Alerts:         {metrics['high_risk_alerts']}",
+        ]
         
         if metrics['alerts_generated'] > 0:
             high_risk_pct = (metrics['high_risk_alerts'] / metrics['alerts_generated']) * 100
-            print(f"High-Risk Percentage:     {high_risk_pct:.1f}%")
+            lines.append(f"High-Risk Percentage:     {high_risk_pct:.1f}%")
         
         if metrics['relevant_emails'] > 0:
             alert_rate = (metrics['alerts_generated'] / metrics['relevant_emails']) * 100
-            print(f"Alert Generation Rate:   {alert_rate:.1f}%")
+            lines.append(f"Alert Generation Rate:   {alert_rate:.1f}%")
         
-        print("="*60 + "\n")
+        lines.append(BAR + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
     
-    def _process_single_email(self, email: Email, po_reference: Optional[str] = None) -> Optional[AlertResult]:
+    def _prepare_email_context(
+        self,
+        email: Email
+    ) -> tuple[Optional[PurchaseOrder], Optional[HistoricalContext], Optional[str]]:
+        """
+        Match an email to its PO and build the historical/RAG context.
+        
+        Args:
+            email: Email to process
+        
+        Returns:
+            Tuple of (matched PO or None, historical context, RAG context text)
+        """
+        # Match to PO first (for RAG context and guardrail)
+        # Create a temporary change for matching
+        temp_change = DeliveryChange(detected=True, confidence=0.5)
+        # The placeholder change carries no PO reference, so the match depends
+        # on the sender alone
+        if email.sender in self._erp_cache:
+            po = self._erp_cache[email.sender]
+        else:
+            po = self._erp_cache[email.sender] = self.erp.match_delivery_change(temp_change, email.sender)
+        
+        # Get historical context (for RAG)
+        context = self.vector_store.build_context(temp_change, po)
+        
+        # Build RAG context
+        po_part = f"PO: {po.po_number}, Supplier: {po.supplier_name}, Priority: {po.priority}" if po else ""
+        context_part = f"Reliability: {context.supplier_reliability_score:.2f}, Past Issues: {context.total_past_issues}" if context else ""
+        if po_part and context_part:
+            rag_context = f"{po_part}\n{context_part}"
+        else:
+            rag_context = po_part or context_part or None
+        
+        return po, context, rag_context
+    
+    def _try_prepare_email_context(self, email: Email) -> Optional[tuple]:
+        """Like _prepare_email_context, but returns None on failure."""
+        try:
+            return self._prepare_email_context(email)
+        except Exception as e:
+            logger.error(f"Error preparing context for email {email.message_id}: {e}")
+            return None
+    
+    def _process_single_email(
+        self,
+        email: Email,
+        po_reference: Optional[str] = None,
+        prepared: Optional[tuple] = None,
+        detection: Optional[tuple[DeliveryChange, Signal]] = None,
+        processed_at: Optional[datetime] = None
+    ) -> Optional[AlertResult]:
         """
         Process a single email through the full pipeline using hybrid architecture.
         
@@ -413,15 +674,18 @@ class HugoAgent:
         Args:
             email: Email to process
             po_reference: Valid PO reference (already validated)
+            prepared: Optional pre-computed result of _prepare_email_context
+            detection: Optional pre-computed (DeliveryChange, Signal) from a batch
+            processed_at: Optional batch timestamp (defaults to now)
         
         Returns:
             AlertResult or None
         """
+        now = processed_at or datetime.utcnow()
+        
         try:
-            # Step 1: Match to PO first (for RAG context and guardrail)
-            # Create a temporary change for matching
-            temp_change = DeliveryChange(detected=True, confidence=0.5)
-            po = self.erp.match_delivery_change(temp_change, email.sender)
+            # Steps 1-3: Match to PO, get historical context, build RAG context
+            po, context, rag_context = prepared or self._prepare_email_context(email)
             
             alert_source = "mapped_po"
             is_unmapped = False
@@ -431,32 +695,23 @@ class HugoAgent:
                 alert_source = "unmapped_supplier"
                 is_unmapped = True
             
-            # Step 2: Get historical context (for RAG)
-            context = self.vector_store.build_context(temp_change, po)
-            
-            # Step 3: Build RAG context
-            rag_context_parts = []
-            if po:
-                rag_context_parts.append(f"PO: {po.po_number}, Supplier: {po.supplier_name}, Priority: {po.priority}")
-            if context:
-                rag_context_parts.append(f"Reliability: {context.supplier_reliability_score:.2f}, Past Issues: {context.total_past_issues}")
-            rag_context = "\n".join(rag_context_parts) if rag_context_parts else None
-            
             # Step 4: Detect delivery changes (extracts signals + calculates values)
-            change, signal = self.detector.detect_changes(email, po, rag_context)
+            change, signal = detection or self.detector.detect_changes(email, po, rag_context)
             
             # Step 5: Check if alert should be generated (with PO validation)
             if not should_generate_alert(change, po_reference, unmapped=is_unmapped):
                 logger.debug(f"Alert creation rules not met: {email.subject[:40]}...")
-                return AlertResult(
+                # Fields are already-validated models; skip re-validation for
+                # this (common) gated result
+                return AlertResult.model_construct(
                     email=email,
                     delivery_change=change,
-                    processed_at=datetime.utcnow()
+                    processed_at=now
                 )
             
             # Step 6: Determine alert severity (deterministic Python logic)
             severity = get_alert_severity(change, unmapped=is_unmapped)
-            logger.info(f"Change detected: {change.change_type.value if change.change_type else 'unknown'} (severity: {severity.value})")
+            logger.info(f"Change detected: {change_type_label(change.change_type)} (severity: {severity.value})")
             
             if po:
                 logger.info(f"Matched to PO: {po.po_number}")
@@ -476,7 +731,7 @@ class HugoAgent:
                 historical_context=context,
                 risk_assessment=risk,
                 alert_source=alert_source,
-                processed_at=datetime.utcnow()
+                processed_at=now
             )
             
         except Exception as e:
@@ -484,7 +739,7 @@ class HugoAgent:
             return AlertResult(
                 email=email,
                 delivery_change=DeliveryChange(detected=False, raw_extract=str(e)),
-                processed_at=datetime.utcnow()
+                processed_at=now
             )
     
     async def process_emails_async(
@@ -495,14 +750,11 @@ class HugoAgent:
         """
         Async version for Streamlit compatibility.
         
-        Runs the synchronous pipeline in a thread pool to avoid blocking.
+        Runs the synchronous pipeline in the loop's default executor to avoid
+        blocking. The per-email work itself fans out on the shared pipeline
+        pool, so the outer call must not occupy a worker of that pool.
         """
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor() as pool:
-            return await loop.run_in_executor(
-                pool,
-                lambda: self.process_emails(query, max_emails)
-            )
+        return await asyncio.to_thread(self.process_emails, query, max_emails)
     
     def process_single_email_from_text(
         self,
@@ -524,7 +776,7 @@ class HugoAgent:
             AlertResult with analysis
         """
         email = Email(
-            message_id=f"manual_{datetime.now().timestamp()}",
+            message_id=f"manual_{time.time_ns()}",
             thread_id="manual_thread",
             sender=sender,
             subject=subject,
@@ -535,6 +787,10 @@ class HugoAgent:
         
         return self._process_single_email(email)
     
+    def clear_erp_cache(self) -> None:
+        """Forget cached sender -> PO matches (call after reloading ERP data)."""
+        self._erp_cache.clear()
+    
     def get_open_orders(self) -> list[PurchaseOrder]:
         """Get all open purchase orders from ERP."""
         return self.erp.get_all_open_orders()
@@ -564,20 +820,21 @@ class HugoAgent:
         
         incident_id = f"inc_{alert.email.message_id}_{datetime.now().timestamp()}"
         
-        description = f"{alert.delivery_change.change_type.value if alert.delivery_change.change_type else 'Unknown'} "
-        description += f"- {alert.delivery_change.supplier_reason or 'No reason provided'}. "
-        if alert.delivery_change.delay_days:
-            description += f"Delay: {alert.delivery_change.delay_days} days. "
-        if alert.matched_po:
-            description += f"Affected PO: {alert.matched_po.po_number}."
+        change = alert.delivery_change
+        change_type = change_type_label(change.change_type, None)
+        description = "".join((
+            f"{change_type or 'Unknown'} - {change.supplier_reason or 'No reason provided'}. ",
+            f"Delay: {change.delay_days} days. " if change.delay_days else "",
+            f"Affected PO: {alert.matched_po.po_number}." if alert.matched_po else "",
+        ))
         
         self.vector_store.add_incident(
             incident_id=incident_id,
             supplier_id=alert.matched_po.supplier_id if alert.matched_po else "UNKNOWN",
             supplier_name=alert.matched_po.supplier_name if alert.matched_po else "Unknown Supplier",
-            incident_type=alert.delivery_change.change_type.value if alert.delivery_change.change_type else "other",
+            incident_type=change_type or "other",
             description=description,
-            delay_days=alert.delivery_change.delay_days or 0,
+            delay_days=change.delay_days or 0,
             resolution=resolution,
             impact_score=alert.risk_assessment.risk_score if alert.risk_assessment else 0.5
         )
@@ -591,9 +848,9 @@ class HugoAgent:
         Args:
             hoarding_results: List of HoardingResult objects
         """
-        print("\n" + "="*60)
+        print("\n" + BAR)
         print("📦 HOARDING RISK SUMMARY")
-        print("="*60)
+        print(BAR)
         
         if not hoarding_results:
             print("No hoarding risk data available.")
@@ -613,7 +870,7 @@ class HugoAgent:
         # High risk materials
         if high_risk:
             print("🔴 HIGH RISK MATERIALS:")
-            print("-" * 40)
+            print(DASH)
             for result in high_risk[:5]:
                 actions = self.hoarding_detector.get_redistribution_actions(result)
                 print(f"  Material: {result.material}")
@@ -625,7 +882,7 @@ class HugoAgent:
         # Medium risk materials
         if medium_risk:
             print("🟡 MEDIUM RISK MATERIALS:")
-            print("-" * 40)
+            print(DASH)
             for result in medium_risk[:3]:
                 actions = self.hoarding_detector.get_redistribution_actions(result)
                 print(f"  Material: {result.material}")
@@ -635,7 +892,7 @@ class HugoAgent:
         
         # Summary
         print("RECOMMENDATIONS:")
-        print("-" * 40)
+        print(DASH)
         if high_risk:
             print("• Immediate redistribution of high-risk excess stock")
             print("• Review procurement policies for affected materials")
@@ -644,7 +901,7 @@ class HugoAgent:
         if total_excess > 1000:
             print(f"• Potential to free up ${total_excess * 50:,.0f}+ in working capital")
         
-        print("="*60 + "\n")
+        print(BAR + "\n")
 
 
 def run_demo(simulation_mode: bool = False):
@@ -654,32 +911,33 @@ def run_demo(simulation_mode: bool = False):
     Args:
         simulation_mode: If True, use dataset-driven time windows
     """
-    print("\n" + "="*60)
+    print("\n" + BAR)
     print("HUGO - Inbox Watchdog Agent Demo")
     if simulation_mode:
         print("MODE: SIMULATION (dataset-driven time windows)")
     else:
         print("MODE: REAL-TIME")
-    print("="*60 + "\n")
+    print(BAR + "\n")
     
     # Initialize agent
-    agent = HugoAgent(simulation_mode=simulation_mode)
-    
-    # Process emails (uses mock data without Gmail credentials)
-    print("Fetching and processing supplier emails...\n")
-    alerts = agent.process_emails(max_emails=5)
-    
-    # Display results
-    for i, alert in enumerate(alerts, 1):
-        print(f"\n{'─'*50}")
-        print(f"Alert #{i}")
-        print(f"{'─'*50}")
-        print(f"From: {alert.email.sender_name or alert.email.sender}")
-        print(f"Subject: {alert.email.subject}")
-        
-        if alert.delivery_change.detected:
+    with HugoAgent(simulation_mode=simulation_mode) as agent:
+        # Process emails (uses mock data without Gmail credentials)
+        print("Fetching and processing supplier emails...\n")
+        alerts = agent.process_emails(max_emails=5)
+        
+        # Display results
+        for i, alert in enumerate(alerts, 1):
+            print(f"\n{THIN}")
+            print(f"Alert #{i}")
+            print(THIN)
+            print(f"From: {alert.email.sender_name or alert.email.sender}")
+            print(f"Subject: {alert.email.subject}")
+            
             change = alert.delivery_change
-            print(f"\nChange Detected: {change.change_type.value if change.change_type else 'Unknown'}")
+            if not change.detected:
+                continue
+            
+            print(f"\nChange Detected: {change_type_label(change.change_type, 'Unknown')}")
             if change.delay_days:
                 print(f"   Delay: {change.delay_days} days")
             if change.affected_items:
@@ -687,16 +945,15 @@ def run_demo(simulation_mode: bool = False):
             if change.po_reference:
                 print(f"   PO Ref: {change.po_reference}")
             
-            if alert.matched_po:
-                po = alert.matched_po
+            po = alert.matched_po
+            if po:
                 print(f"\n📦 Matched PO: {po.po_number}")
                 print(f"   Supplier: {po.supplier_name}")
                 print(f"   Value: ${po.total_value:,.2f}")
                 print(f"   Priority: {po.priority.upper()}")
             
-            if alert.risk_assessment:
-                risk = alert.risk_assessment
-                level_emoji = {"low": "🟢", "medium": "🟡", "high": "🟠", "critical": "🔴"}
+            risk = alert.risk_assessment
+            if risk:
                 print(f"\nRisk Assessment: {risk.risk_level.value.upper()}")
                 print(f"   Score: {risk.risk_score:.0%}")
                 print(f"   Impact: {risk.impact_summary}")
@@ -704,27 +961,27 @@ def run_demo(simulation_mode: bool = False):
                     print(f"\n   Recommended Actions:")
                     for action in risk.recommended_actions[:3]:
                         print(f"   • {action}")
-    
-    print(f"\n{'='*60}")
-    print(f"Processed {len(alerts)} alerts")
-    print("="*60 + "\n")
-    
-    # Run Inventory Balancer
-    print("Running Inventory Balancer analysis...")
-    recommendations = agent.inventory_balancer.analyze_inventory()
-    agent.inventory_balancer.print_summary(recommendations)
-    
-    # Run Priority Wars (NEW FEATURE)
-    print("\nRunning Priority Wars analysis...")
-    priority_conflicts = agent.inventory_balancer.detect_priority_conflicts(recommendations)
-    agent.inventory_balancer.print_priority_wars_summary(priority_conflicts)
-    
-    # Run Hoarding Detection
-    print("\nRunning Hoarding Risk analysis...")
-    hoarding_results = agent.hoarding_detector.analyze_all_materials()
-    agent._print_hoarding_summary(hoarding_results)
-    
-    return alerts
+        
+        print(f"\n{BAR}")
+        print(f"Processed {len(alerts)} alerts")
+        print(BAR + "\n")
+        
+        # Run Inventory Balancer
+        print("Running Inventory Balancer analysis...")
+        recommendations = agent.inventory_balancer.analyze_inventory()
+        agent.inventory_balancer.print_summary(recommendations)
+        
+        # Run Priority Wars (NEW FEATURE)
+        print("\nRunning Priority Wars analysis...")
+        priority_conflicts = agent.inventory_balancer.detect_priority_conflicts(recommendations)
+        agent.inventory_balancer.print_priority_wars_summary(priority_conflicts)
+        
+        # Run Hoarding Detection
+        print("\nRunning Hoarding Risk analysis...")
+        hoarding_results = agent.hoarding_detector.analyze_all_materials()
+        agent._print_hoarding_summary(hoarding_results)
+        
+        return alerts
 
 
 # Entry point
@@ -6,11 +6,15 @@ HYBRID ARCHITECTURE: LLM extracts semantic signals only. Python computes all val
 LLMs are constrained to semantic understanding only. All decisions are deterministic.
 """
 
+import functools
+import logging
 from typing import Optional
 from datetime import datetime
+from concurrent.futures import Executor, ThreadPoolExecutor
 
+from config.settings import settings
 from models.schemas import Email, DeliveryChange, PurchaseOrder, Signal
-from utils.helpers import setup_logging
+from utils.helpers import setup_logging, change_type_label
 from services.signal_extractor import SignalExtractor
 from services.deterministic_logic import (
     calculate_delay_days,
@@ -20,6 +24,16 @@ from services.deterministic_logic import (
 
 logger = setup_logging()
 
+
+@functools.lru_cache(maxsize=1024)
+def _parse_ymd(date_str: str) -> Optional[datetime]:
+    """Parse a YYYY-MM-DD string (memoized; dates repeat heavily across a batch)."""
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%d")
+    except ValueError:
+        return None
+
+
 # LLMs are constrained to semantic understanding only. All decisions are deterministic.
 
 
@@ -30,6 +44,10 @@ class DeliveryDetector:
     LLM extracts semantic signals only. Python computes delay_days, quantity_change, and all values deterministically.
     """
     
+    # Emails per extraction chunk (the extractor splits a chunk further so each
+    # prompt fits the model's context)
+    BATCH_SIZE = 5
+    
     def __init__(self):
         """Initialize detector with signal extractor."""
         self.signal_extractor = SignalExtractor()
@@ -55,25 +73,8 @@ class DeliveryDetector:
         try:
             # Step 1: Extract semantic signals from LLM
             signal = self.signal_extractor.extract_signals(email, rag_context)
-            logger.info(f"Signals extracted: delay={signal.delay_mentioned}, qty={signal.quantity_change_mentioned}, eta={signal.eta_changed}")
-            
-            # Step 2: Calculate delay_days deterministically in Python
-            today = datetime.now()
-            delay_days = calculate_delay_days(signal, po, email.body, today)
-            
-            # Step 3: Calculate quantity_change deterministically in Python
-            quantity_change = calculate_quantity_change(signal, email.body)
             
-            # Step 4: Build DeliveryChange from signals and calculated values
-            delivery_change = build_delivery_change(
-                signal=signal,
-                delay_days=delay_days,
-                quantity_change=quantity_change,
-                email_body=email.body,
-                po=po
-            )
-            
-            logger.info(f"Delivery change detected: {delivery_change.detected}, type: {delivery_change.change_type}")
+            delivery_change = self._build_change(email, signal, po)
             return delivery_change, signal
             
         except Exception as e:
@@ -85,6 +86,107 @@ class DeliveryDetector:
                 raw_extract=f"Error: {e}"
             ), FallbackSignal()
     
+    def detect_changes_batch(
+        self,
+        emails: list[Email],
+        pos: Optional[list[Optional[PurchaseOrder]]] = None,
+        rag_contexts: Optional[list[Optional[str]]] = None,
+        executor: Optional[Executor] = None
+    ) -> list[tuple[DeliveryChange, Signal]]:
+        """
+        Analyze several emails for delivery changes, sharing LLM calls.
+        
+        Signals are extracted for up to BATCH_SIZE emails per LLM prompt;
+        values are then computed per email exactly as in detect_changes.
+        
+        Args:
+            emails: Parsed Email objects
+            pos: Optional purchase order per email (aligned to emails)
+            rag_contexts: Optional RAG context per email (aligned to emails)
+            executor: Optional executor to run the per-chunk LLM calls concurrently
+        
+        Returns:
+            List of (DeliveryChange, Signal) tuples aligned to emails
+        """
+        if pos is None:
+            pos = [None] * len(emails)
+        if rag_contexts is None:
+            rag_contexts = [None] * len(emails)
+        
+        starts = range(0, len(emails), self.BATCH_SIZE)
+        
+        # One reference date for the whole batch
+        today = datetime.now()
+        
+        # Step 1: Extract semantic signals, one LLM call per chunk
+        def extract(start: int) -> list[Signal]:
+            return self.signal_extractor.extract_signals_batch(
+                emails[start:start + self.BATCH_SIZE],
+                rag_contexts[start:start + self.BATCH_SIZE],
+                today=today
+            )
+        
+        signal_chunks = executor.map(extract, starts) if executor else map(extract, starts)
+        
+        results = []
+        for start, signals in zip(starts, signal_chunks):
+            chunk = emails[start:start + self.BATCH_SIZE]
+            chunk_pos = pos[start:start + self.BATCH_SIZE]
+            
+            # Steps 2-4: Deterministic values per email
+            for email, po, signal in zip(chunk, chunk_pos, signals):
+                try:
+                    results.append((self._build_change(email, signal, po, today), signal))
+                except Exception as e:
+                    logger.error(f"Unexpected error in detect_changes_batch: {e}")
+                    results.append((DeliveryChange(
+                        detected=False,
+                        confidence=0.0,
+                        raw_extract=f"Error: {e}"
+                    ), Signal()))
+        
+        return results
+    
+    def _build_change(
+        self,
+        email: Email,
+        signal: Signal,
+        po: Optional[PurchaseOrder] = None,
+        today: Optional[datetime] = None
+    ) -> DeliveryChange:
+        """
+        Compute a DeliveryChange from extracted signals (deterministic).
+        
+        Args:
+            email: Email the signals were extracted from
+            signal: Semantic signals
+            po: Optional purchase order for context
+            today: Reference date (defaults to now; shared across a batch)
+        
+        Returns:
+            DeliveryChange
+        """
+        logger.info(f"Signals extracted: delay={signal.delay_mentioned}, qty={signal.quantity_change_mentioned}, eta={signal.eta_changed}")
+        
+        # Step 2: Calculate delay_days deterministically in Python
+        today = today or datetime.now()
+        delay_days = calculate_delay_days(signal, po, email.body, today)
+        
+        # Step 3: Calculate quantity_change deterministically in Python
+        quantity_change = calculate_quantity_change(signal, email.body)
+        
+        # Step 4: Build DeliveryChange from signals and calculated values
+        delivery_change = build_delivery_change(
+            signal=signal,
+            delay_days=delay_days,
+            quantity_change=quantity_change,
+            email_body=email.body,
+            po=po
+        )
+        
+        logger.info(f"Delivery change detected: {delivery_change.detected}, type: {delivery_change.change_type}")
+        return delivery_change
+    
     def _parse_date_string(self, date_str: Optional[str]) -> Optional[datetime]:
         """
         Parse a date string in YYYY-MM-DD format.
@@ -98,11 +200,10 @@ class DeliveryDetector:
         if not date_str or date_str == "null":
             return None
         
-        try:
-            return datetime.strptime(date_str, "%Y-%m-%d")
-        except ValueError:
+        parsed = _parse_ymd(date_str)
+        if parsed is None:
             logger.warning(f"Could not parse date: {date_str}")
-            return None
+        return parsed
     
     def batch_detect(self, emails: list[Email]) -> list[DeliveryChange]:
         """
@@ -114,15 +215,23 @@ class DeliveryDetector:
         Returns:
             List of DeliveryChange results
         """
-        results = []
-        for email in emails:
-            logger.info(f"Processing email: {email.subject[:50]}...")
-            result, _ = self.detect_changes(email)
-            results.append(result)
-            
-            if result.detected:
-                logger.info(f"  → Detected: {result.change_type.value if result.change_type else 'unknown'} (confidence: {result.confidence:.0%})")
-            else:
-                logger.info(f"  → No delivery change detected")
+        # Chunked LLM calls overlap on a bounded pool instead of running back to back
+        chunks = -(-len(emails) // self.BATCH_SIZE)
+        if chunks > 1:
+            with ThreadPoolExecutor(max_workers=min(chunks, settings.MAX_PIPELINE_WORKERS or 8)) as pool:
+                detections = self.detect_changes_batch(emails, executor=pool)
+        else:
+            detections = self.detect_changes_batch(emails)
+        results = [change for change, _ in detections]
+        
+        # Per-email report; skip building the messages when INFO is filtered out
+        if logger.isEnabledFor(logging.INFO):
+            for email, result in zip(emails, results):
+                logger.info(f"Processing email: {email.subject[:50]}...")
+                
+                if result.detected:
+                    logger.info(f"  → Detected: {change_type_label(result.change_type)} (confidence: {result.confidence:.0%})")
+                else:
+                    logger.info(f"  → No delivery change detected")
         
         return results
@@ -329,7 +329,7 @@ def build_delivery_change(
         original_date=None,
         new_date=None,
         delay_days=delay_days,
-        affected_items=list(set(affected_items)),  # Remove duplicates
+        affected_items=list(dict.fromkeys(affected_items)),  # Remove duplicates, keep first-seen order
         quantity_change=quantity_change,
         supplier_reason=None,  # Not extracted in signal-based approach
         po_reference=po_reference,
@@ -382,11 +382,12 @@ def build_risk_assessment(
     
     # Generate recommended actions
     actions = []
-    if risk_level in [RiskLevel.HIGH, RiskLevel.CRITICAL]:
+    # risk_level comes from classify_risk_level; members are singletons
+    if risk_level is RiskLevel.HIGH or risk_level is RiskLevel.CRITICAL:
         actions.append("Contact supplier immediately")
         actions.append("Assess alternative suppliers")
         actions.append("Notify production planning")
-    elif risk_level == RiskLevel.MEDIUM:
+    elif risk_level is RiskLevel.MEDIUM:
         actions.append("Monitor situation closely")
         actions.append("Document supplier communication")
     else:
@@ -394,11 +395,11 @@ def build_risk_assessment(
     
     # Calculate urgency hours
     urgency_hours = None
-    if risk_level == RiskLevel.CRITICAL:
+    if risk_level is RiskLevel.CRITICAL:
         urgency_hours = 4
-    elif risk_level == RiskLevel.HIGH:
+    elif risk_level is RiskLevel.HIGH:
         urgency_hours = 12
-    elif risk_level == RiskLevel.MEDIUM:
+    elif risk_level is RiskLevel.MEDIUM:
         urgency_hours = 24
     
     # Generate reasoning
@@ -7,9 +7,10 @@ Fetches and parses supplier emails via Gmail API.
 
 import base64
 import os
+import sys
 from datetime import datetime
 from typing import Optional
-from email.utils import parsedate_to_datetime
+from email.utils import parseaddr, parsedate_to_datetime
 
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
@@ -23,6 +24,9 @@ from utils.helpers import clean_text, setup_logging
 
 logger = setup_logging()
 
+# Sub-requests per Gmail batch call (Google allows 100; 50 avoids rate limiting)
+GMAIL_BATCH_SIZE = 50
+
 
 class EmailIngestionService:
     """
@@ -96,9 +100,12 @@ class EmailIngestionService:
             messages = result.get('messages', [])
             logger.info(f"Found {len(messages)} emails matching query")
             
+            # Bodies arrive via batch requests; anything missing is fetched singly
+            fetched = self._fetch_full_messages(messages)
+            
             emails = []
             for message in messages:
-                email = self._parse_message(message)
+                email = self._parse_message(message, fetched.get(message['id']))
                 if email:
                     emails.append(email)
             
@@ -109,29 +116,68 @@ class EmailIngestionService:
             # Return mock data for demo
             return self._get_mock_emails()
     
-    def _parse_message(self, message) -> Optional[Email]:
-        """Parse a Gmail message into Email object."""
+    def _fetch_full_messages(self, messages: list[dict]) -> dict[str, dict]:
+        """
+        Fetch full message resources with Gmail batch requests.
+        
+        Each batch carries up to GMAIL_BATCH_SIZE messages.get calls in one HTTP
+        round trip. Messages whose sub-request failed are left out.
+        
+        Args:
+            messages: Message stubs from messages.list
+        
+        Returns:
+            Dict mapping message id to full message resource
+        """
+        fetched = {}
+        if not messages or not hasattr(self.service, 'new_batch_http_request'):
+            return fetched
+        
+        def collect(request_id, response, exception):
+            if exception is not None:
+                logger.warning(f"Batch fetch failed for message {request_id}: {exception}")
+            else:
+                fetched[request_id] = response
+        
+        try:
+            for start in range(0, len(messages), GMAIL_BATCH_SIZE):
+                batch = self.service.new_batch_http_request(callback=collect)
+                for message in messages[start:start + GMAIL_BATCH_SIZE]:
+                    batch.add(
+                        self.service.users().messages().get(userId='me', id=message['id'], format='full'),
+                        request_id=message['id']
+                    )
+                batch.execute()
+        except Exception as e:
+            logger.warning(f"Batch message fetch failed, fetching remaining messages singly: {e}")
+        
+        return fetched
+    
+    def _parse_message(self, message, msg: Optional[dict] = None) -> Optional[Email]:
+        """
+        Parse a Gmail message into Email object.
+        
+        Args:
+            message: Message stub from messages.list
+            msg: Full message resource, if already fetched (fetched here otherwise)
+        
+        Returns:
+            Email, or None if the message can't be fetched or parsed
+        """
         try:
             # Get full message
-            msg = self.service.users().messages().get(
-                userId='me',
-                id=message['id'],
-                format='full'
-            ).execute()
-            
-            # Extract headers
-            headers = msg['payload']['headers']
-            subject = ''
-            sender = ''
-            date = ''
+            if msg is None:
+                msg = self.service.users().messages().get(
+                    userId='me',
+                    id=message['id'],
+                    format='full'
+                ).execute()
             
-            for header in headers:
-                if header['name'].lower() == 'subject':
-                    subject = header['value']
-                elif header['name'].lower() == 'from':
-                    sender = header['value']
-                elif header['name'].lower() == 'date':
-                    date = header['value']
+            # Extract headers (one pass; last occurrence wins)
+            headers = {h['name'].lower(): h['value'] for h in msg['payload']['headers']}
+            subject = headers.get('subject', '')
+            sender = headers.get('from', '')
+            date = headers.get('date', '')
             
             # Parse date
             received_at = parsedate_to_datetime(date) or datetime.now()
@@ -139,14 +185,14 @@ class EmailIngestionService:
             # Extract body
             body = self._extract_body(msg['payload'])
             
-            # Extract sender name and email
-            sender_name = ''
-            if '<' in sender:
-                sender_name = sender.split('<')[0].strip()
-                sender_email = sender.split('<')[1].split('>')[0].strip()
-            else:
-                sender_name = sender
-                sender_email = sender
+            # Extract sender name and email (RFC 2822 aware; keep the raw
+            # header as the address if it doesn't parse)
+            sender_name, sender_email = parseaddr(sender)
+            sender_email = sender_email or sender
+            
+            # Supplier addresses repeat heavily within a batch; intern so every
+            # Email from one sender shares a single string (cheap dict lookups)
+            sender_email = sys.intern(sender_email)
             
             # Create Email object
             return Email(
@@ -165,28 +211,28 @@ class EmailIngestionService:
             return None
     
     def _extract_body(self, payload) -> str:
-        """Extract email body from message payload."""
-        body = ''
+        """
+        Extract email body from message payload.
+        
+        text/plain is preferred; an HTML part is only decoded and converted
+        when no plain-text part exists. Empty parts and attachments are skipped.
+        """
+        parts = payload['parts'] if 'parts' in payload else [payload]
+        html_data = None
         
-        if 'parts' in payload:
-            for part in payload['parts']:
-                if part['mimeType'] == 'text/plain':
-                    data = part['body']['data']
-                    body = base64.urlsafe_b64decode(data).decode('utf-8')
-                elif part['mimeType'] == 'text/html':
-                    data = part['body']['data']
-                    html_body = base64.urlsafe_b64decode(data).decode('utf-8')
-                    body = html2text.html2text(html_body)
-        else:
-            if payload['mimeType'] == 'text/plain':
-                data = payload['body']['data']
-                body = base64.urlsafe_b64decode(data).decode('utf-8')
-            elif payload['mimeType'] == 'text/html':
-                data = payload['body']['data']
-                html_body = base64.urlsafe_b64decode(data).decode('utf-8')
-                body = html2text.html2text(html_body)
+        for part in parts:
+            data = part.get('body', {}).get('data')
+            if not data:
+                continue
+            if part['mimeType'] == 'text/plain':
+                return base64.urlsafe_b64decode(data).decode('utf-8', 'replace')
+            if part['mimeType'] == 'text/html' and html_data is None:
+                html_data = data
         
-        return body
+        if html_data is None:
+            return ''
+        html_body = base64.urlsafe_b64decode(html_data).decode('utf-8', 'replace')
+        return html2text.html2text(html_body)
     
     def _get_mock_emails(self) -> list[Email]:
         """Return mock emails for demo purposes."""
@@ -8,6 +8,11 @@ import logging
 from typing import Optional
 from pathlib import Path
 
+try:
+    import pandas as pd
+except ImportError:  # pandas is optional here; the CSV loader falls back to pure Python
+    pd = None
+
 from models.schemas import DeliveryChange, PurchaseOrder
 from utils.helpers import setup_logging
 
@@ -20,6 +25,11 @@ class ERPMatcher:
     def __init__(self):
         """Initialize ERP matcher."""
         self.purchase_orders = self._load_purchase_orders()
+        # Lowercased supplier name -> first PO for that supplier (load order),
+        # so sender matching scans distinct suppliers rather than every PO
+        self._supplier_index: dict[str, PurchaseOrder] = {}
+        for po in self.purchase_orders.values():
+            self._supplier_index.setdefault(po.supplier_name.lower(), po)
         logger.info(f"Loaded {len(self.purchase_orders)} purchase orders")
     
     def _load_purchase_orders(self) -> dict[str, PurchaseOrder]:
@@ -28,6 +38,12 @@ class ERPMatcher:
         
         # Try to load from CSV
         csv_path = Path("hugo_data_samples/material_orders.csv")
+        if csv_path.exists() and pd is not None:
+            try:
+                return self._load_purchase_orders_pandas(csv_path)
+            except Exception as e:
+                logger.debug(f"Vectorized PO load failed, using row parser: {e}")
+        
         if csv_path.exists():
             try:
                 import csv
@@ -50,6 +66,50 @@ class ERPMatcher:
         
         return orders
     
+    def _load_purchase_orders_pandas(self, csv_path: Path) -> dict[str, PurchaseOrder]:
+        """
+        Vectorized variant of _load_purchase_orders (C parser, typed columns).
+        
+        Parsing is strict: any malformed value raises so the caller can fall back
+        to the tolerant row-by-row parser.
+        """
+        df = pd.read_csv(
+            csv_path,
+            dtype={
+                'order_id': str, 'supplier': str, 'supplier_id': str,
+                'material_id': str, 'priority': str,
+                'quantity': 'int64', 'value': 'float64'
+            },
+            keep_default_na=False,
+            engine='c'
+        )
+        rows = len(df)
+        
+        def column(name: str, default) -> list:
+            return df[name].tolist() if name in df.columns else [default] * rows
+        
+        orders = {}
+        for po_number, supplier_name, supplier_id, material_id, quantity, priority, total_value in zip(
+            column('order_id', ''),
+            column('supplier', 'Unknown'),
+            column('supplier_id', ''),
+            column('material_id', ''),
+            column('quantity', 0),
+            column('priority', 'normal'),
+            column('value', 0.0)
+        ):
+            orders[po_number] = PurchaseOrder(
+                po_number=po_number,
+                supplier_name=supplier_name,
+                supplier_id=supplier_id,
+                material_id=material_id,
+                quantity=quantity,
+                expected_delivery=None,
+                priority=priority,
+                total_value=total_value
+            )
+        return orders
+    
     def match_delivery_change(self, change: DeliveryChange, sender_email: str) -> Optional[PurchaseOrder]:
         """Match delivery change to purchase order."""
         # Simple matching by PO reference if available
@@ -57,8 +117,8 @@ class ERPMatcher:
             return self.purchase_orders[change.po_reference]
         
         # Try to match by sender email
-        for po in self.purchase_orders.values():
-            if sender_email in po.supplier_name.lower():
+        for supplier, po in self._supplier_index.items():
+            if sender_email in supplier:
                 return po
         
         return None
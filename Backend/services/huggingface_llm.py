@@ -6,13 +6,30 @@ Replaces local Ollama usage with production-ready HF Inference API.
 import os
 import json
 import logging
+import time
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Any, Dict, Optional
 from huggingface_hub import InferenceClient
-from services.json_repair import attempt_json_repair, clean_json_text, normalize_json_output
+
+try:
+    import orjson
+except ImportError:  # orjson is optional here; falls back to requests' stdlib decoder
+    orjson = None
+
+from services.json_repair import attempt_json_repair, normalize_json_output, parse_json_text
 
 logger = logging.getLogger("hugo.huggingface")
 
+# One keep-alive connection pool for every HuggingFaceLLM instance, sized for
+# the agent's concurrent email pipelines
+_HTTP_POOL_SIZE = 16
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=_HTTP_POOL_SIZE, pool_maxsize=_HTTP_POOL_SIZE))
+
+# Upper bound on honouring the API's "estimated_time" while a model loads
+_MAX_COLD_START_WAIT = 20.0
+
 
 class HuggingFaceLLM:
     """
@@ -35,7 +52,9 @@ class HuggingFaceLLM:
         
         self.model = model
         self.api_url = f"https://router.huggingface.co/models/{model}"
-        self.headers = {"Authorization": f"Bearer {self.token}"}
+        # Ask the API to hold the request while the model loads instead of 503ing
+        self.headers = {"Authorization": f"Bearer {self.token}", "x-wait-for-model": "true"}
+        self.session = _session
         # Keep client for other hub-related utilities if needed
         self.client = InferenceClient(model=model, token=self.token)
 
@@ -61,18 +80,17 @@ class HuggingFaceLLM:
                 }
             }
             
-            response = requests.post(
+            response = self.session.post(
                 self.api_url,
                 headers=self.headers,
                 json=payload,
                 timeout=30
             )
             
-            if response.status_code == 429:
-                # Rate limited - wait and retry once
-                import time
-                time.sleep(2)
-                response = requests.post(
+            if response.status_code in (429, 503):
+                # Rate limited or model still loading - wait and retry once
+                time.sleep(self._retry_delay(response))
+                response = self.session.post(
                     self.api_url,
                     headers=self.headers,
                     json=payload,
@@ -81,7 +99,7 @@ class HuggingFaceLLM:
             
             response.raise_for_status()
             
-            result = response.json()
+            result = orjson.loads(response.content) if orjson is not None else response.json()
             
             # Handle different response formats
             if isinstance(result, list) and len(result) > 0:
@@ -116,6 +134,32 @@ class HuggingFaceLLM:
             logger.error(f"Unexpected error in HuggingFace LLM: {e}")
             raise RuntimeError(f"HF Inference API error: {str(e)}") from e
     
+    @staticmethod
+    def _retry_delay(response: requests.Response) -> float:
+        """Seconds to wait before retrying a 429/503 response."""
+        if response.status_code == 503:
+            try:
+                estimated = float(response.json().get("estimated_time", 2))
+            except (ValueError, AttributeError):
+                estimated = 2.0
+            return min(max(estimated, 0.0), _MAX_COLD_START_WAIT)
+        return 2.0
+    
+    def warm_up(self) -> bool:
+        """
+        Send a tiny prompt so the hosted model is loaded before real traffic.
+        
+        Returns:
+            True if the model answered, False otherwise (never raises)
+        """
+        try:
+            self.generate("ping")
+            logger.info(f"Hugging Face model warmed up: {self.model}")
+            return True
+        except Exception as e:
+            logger.warning(f"Hugging Face warm-up failed: {e}")
+            return False
+    
     def generate_json(self, prompt: str, schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Generate JSON output using the LLM with automatic repair.
@@ -133,11 +177,9 @@ class HuggingFaceLLM:
             if not response:
                 return {}
             
-            # Clean and parse JSON
-            cleaned_text = clean_json_text(response)
-            
+            # Clean and parse JSON (first complete object; trailing text ignored)
             try:
-                parsed = json.loads(cleaned_text)
+                parsed = parse_json_text(response)
                 return parsed
             except json.JSONDecodeError as e:
                 logger.warning(f"JSON parsing failed, attempting repair: {e}")
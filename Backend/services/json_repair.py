@@ -19,6 +19,9 @@ from huggingface_hub import InferenceClient
 
 logger = logging.getLogger("hugo.json_repair")
 
+# Shared decoder: raw_decode stops at the end of the first complete value
+_JSON_DECODER = json.JSONDecoder()
+
 # Repair prompt for Ollama
 # Updated Repair Prompt
 REPAIR_PROMPT = """Fix the following JSON to match this schema exactly. Output JSON only.
@@ -141,8 +144,7 @@ def attempt_json_repair(
             fixed_response = _call_hf_for_repair(repair_prompt, model, timeout)
             
             # Clean and parse
-            cleaned_fixed = clean_json_text(fixed_response)
-            result = json.loads(cleaned_fixed)
+            result = parse_json_text(fixed_response)
             
             # Normalize immediately after parse
             normalized_result = normalize_json_output(result)
@@ -222,9 +224,30 @@ def clean_json_text(text: str) -> str:
     return text
 
 
+def parse_json_text(text: str) -> Any:
+    """
+    Clean LLM output and decode the first complete JSON value in it.
+    
+    Unlike json.loads(), trailing text after the value (model chatter,
+    a second object) is ignored rather than scanned and rejected.
+    
+    Args:
+        text: Raw response text
+    
+    Returns:
+        Decoded JSON value
+    
+    Raises:
+        json.JSONDecodeError: If no JSON value starts the cleaned text
+    """
+    obj, _ = _JSON_DECODER.raw_decode(clean_json_text(text))
+    return obj
+
+
 # Export public API
 __all__ = [
     "attempt_json_repair",
     "clean_json_text",
     "normalize_json_output",
+    "parse_json_text",
 ]
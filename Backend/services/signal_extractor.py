@@ -8,12 +8,16 @@ This service extracts ONLY semantic signals from emails - no numbers, no calcula
 """
 
 import logging
+import re
+import threading
+from collections import OrderedDict
 from typing import Optional
 from datetime import datetime
 
+from config.settings import settings
 from models.schemas import Email, Signal, UrgencyLevel, CommitmentConfidence, SupplierSentiment
 from services.huggingface_llm import HuggingFaceLLM
-from utils.helpers import setup_logging
+from utils.helpers import setup_logging, strip_quoted_reply
 
 logger = setup_logging()
 
@@ -40,6 +44,33 @@ eta_changed: true / false
 
 CRITICAL: Return ONLY those 3 lines. Do NOT use JSON. Do NOT output reasoning or explanations."""
 
+# Batched variant - shared instructions paid once for several emails
+SIGNAL_BATCH_EXTRACTION_PROMPT = """Extract semantic signals from each of these {count} supplier emails.
+
+You are a semantic signal extractor. Extract ONLY semantic understanding.
+
+TODAY: {today} ({day_of_week})
+
+{emails}
+
+=== EXTRACTION RULES ===
+For EACH email output exactly these 3 lines, prefixed with its number in brackets:
+[1] delay_mentioned: true / false
+[1] quantity_changed: true / false
+[1] eta_changed: true / false
+
+CRITICAL: Return ONLY those lines ({count} x 3). Do NOT use JSON. Do NOT output reasoning or explanations."""
+
+SIGNAL_BATCH_EMAIL_BLOCK = """=== EMAIL [{idx}] ===
+From: {sender}
+Subject: {subject}
+Body: {body}
+
+=== CONTEXT [{idx}] (READ-ONLY) ===
+{rag_context}"""
+
+_BATCH_LINE_RE = re.compile(r"^\[?(\d+)\]?[.:)]?\s*([a-z_]+)\s*:\s*(.*)$")
+
 
 class SignalExtractor:
     """
@@ -49,15 +80,52 @@ class SignalExtractor:
     This class extracts ONLY semantic signals - no numbers, no calculations, no decisions.
     """
     
+    # Per-email body budget inside a batched prompt
+    BATCH_BODY_CHARS = 1500
+    
+    # Rough chars-per-token ratio used to estimate prompt size
+    CHARS_PER_TOKEN = 4
+    
+    # LLM-derived signals kept for identical (templated) emails
+    SIGNAL_CACHE_SIZE = 1024
+    
     def __init__(self):
         """Initialize signal extractor with Hugging Face LLM."""
-        self.llm = HuggingFaceLLM()
+        self.llm = HuggingFaceLLM(settings.EXTRACTION_MODEL)
+        # Input budget of a batched prompt, matched to the extraction model
+        self.prompt_token_budget = settings.EXTRACTION_CONTEXT_TOKENS
+        self._signal_cache: "OrderedDict[tuple, Signal]" = OrderedDict()
+        self._signal_cache_lock = threading.Lock()
         logger.info("SignalExtractor initialized")
     
+    @staticmethod
+    def _signal_cache_key(email: Email, rag_context: Optional[str]) -> tuple:
+        """Everything the extraction prompt depends on, apart from the date."""
+        return (email.sender, email.subject, email.body, rag_context)
+    
+    def _cached_signal(self, email: Email, rag_context: Optional[str]) -> Optional[Signal]:
+        """Return the signal cached for an identical email, if any."""
+        key = self._signal_cache_key(email, rag_context)
+        with self._signal_cache_lock:
+            signal = self._signal_cache.get(key)
+            if signal is not None:
+                self._signal_cache.move_to_end(key)
+        return signal
+    
+    def _cache_signal(self, email: Email, rag_context: Optional[str], signal: Signal) -> Signal:
+        """Store an LLM-derived signal, evicting the least recently used entry when full."""
+        key = self._signal_cache_key(email, rag_context)
+        with self._signal_cache_lock:
+            self._signal_cache[key] = signal
+            if len(self._signal_cache) > self.SIGNAL_CACHE_SIZE:
+                self._signal_cache.popitem(last=False)
+        return signal
+    
     def extract_signals(
         self,
         email: Email,
-        rag_context: Optional[str] = None
+        rag_context: Optional[str] = None,
+        today: Optional[datetime] = None
     ) -> Signal:
         """
         Extract semantic signals from email.
@@ -65,11 +133,17 @@ class SignalExtractor:
         Args:
             email: Email to analyze
             rag_context: Optional RAG context (PO metadata, ERP data, SLA terms)
+            today: Reference date for the prompt (defaults to now)
         
         Returns:
             Signal object with semantic understanding
         """
-        today = datetime.now()
+        cached = self._cached_signal(email, rag_context)
+        if cached is not None:
+            logger.debug("Reusing cached signals for identical email")
+            return cached
+        
+        today = today or datetime.now()
         day_of_week = today.strftime("%A")
         
         context_text = rag_context or "No additional context available"
@@ -78,7 +152,7 @@ class SignalExtractor:
             prompt = SIGNAL_EXTRACTION_PROMPT.format(
                 sender=f"{email.sender_name or ''} <{email.sender}>",
                 subject=email.subject,
-                body=email.body[:4000],
+                body=strip_quoted_reply(email.body)[:4000],
                 today=today.strftime("%Y-%m-%d"),
                 day_of_week=day_of_week,
                 rag_context=context_text
@@ -102,39 +176,173 @@ class SignalExtractor:
                             key = "quantity_change_mentioned"
                         signals[key] = 'true' in val
             
-            # If LLM fails OR returns empty signals, apply fallback heuristics
-            if not response or not any(signals.values()):
-                if not response:
-                    logger.warning("LLM unavailable — deterministic fallback used")
-                else:
-                    logger.debug("LLM returned all FALSE - checking heuristics as backup")
-                
-                heuristic_signals = self._get_heuristic_signals(email)
-                if any(heuristic_signals.values()):
-                    if not response:
-                        logger.info("LLM unavailable — deterministic fallback used")
-                    else:
-                        logger.info("Heuristics detected signal missed by LLM")
-                    signals.update({k: v for k, v in heuristic_signals.items() if v})
-
-            logger.info(f"Extracted signals: {signals}")
-            
-            # Parse signal with validation
-            return Signal(
-                delay_mentioned=signals.get("delay_mentioned", False),
-                quantity_change_mentioned=signals.get("quantity_change_mentioned", False),
-                eta_changed=signals.get("eta_changed", False),
-                # Use defaults for the rest
-                urgency_level=UrgencyLevel.LOW,
-                commitment_confidence=CommitmentConfidence.MEDIUM,
-                supplier_sentiment=SupplierSentiment.NEUTRAL,
-                ambiguity_detected=False
-            )
+            return self._cache_signal(email, rag_context, self._build_signal(email, signals, response))
             
         except Exception as e:
             logger.error(f"Signal extraction failed: {e}")
             logger.warning("LLM unavailable — deterministic fallback used")
             return self._fallback_heuristic(email)
+    
+    def extract_signals_batch(
+        self,
+        emails: list[Email],
+        rag_contexts: Optional[list[Optional[str]]] = None,
+        today: Optional[datetime] = None
+    ) -> list[Signal]:
+        """
+        Extract semantic signals for several emails, sharing LLM calls.
+        
+        The extraction instructions are sent once per prompt and each email is
+        numbered; the response is parsed back into one Signal per input email.
+        Emails are packed into as few prompts as fit the model's input
+        (settings.EXTRACTION_CONTEXT_TOKENS), so a small-context model may get
+        one email per call. Emails missing from a response fall back to a
+        single-email extraction.
+        
+        Args:
+            emails: Emails to analyze
+            rag_contexts: Optional RAG context per email (aligned to emails)
+            today: Reference date for the prompt (defaults to now)
+        
+        Returns:
+            List of Signal objects aligned to emails
+        """
+        if not emails:
+            return []
+        if rag_contexts is None:
+            rag_contexts = [None] * len(emails)
+        
+        # Identical emails seen recently reuse their signals; only misses go to the LLM
+        results = [self._cached_signal(email, rag_context) for email, rag_context in zip(emails, rag_contexts)]
+        misses = [idx for idx, signal in enumerate(results) if signal is None]
+        if len(misses) < len(emails):
+            if misses:
+                fresh = self.extract_signals_batch(
+                    [emails[idx] for idx in misses],
+                    [rag_contexts[idx] for idx in misses],
+                    today
+                )
+                for idx, signal in zip(misses, fresh):
+                    results[idx] = signal
+            return results
+        
+        today = today or datetime.now()
+        
+        # Emails are packed into prompts that fit the model's input; an email
+        # that can't share a prompt is asked on its own
+        results = []
+        for start, stop in self._batch_slices(emails, rag_contexts):
+            if stop - start == 1:
+                results.append(self.extract_signals(emails[start], rag_contexts[start], today))
+            else:
+                results.extend(self._extract_signals_prompt(emails[start:stop], rag_contexts[start:stop], today))
+        return results
+    
+    def _batch_block(self, idx: int, email: Email, rag_context: Optional[str]) -> str:
+        """One numbered email section of a batched prompt."""
+        return SIGNAL_BATCH_EMAIL_BLOCK.format(
+            idx=idx,
+            sender=f"{email.sender_name or ''} <{email.sender}>",
+            subject=email.subject,
+            body=strip_quoted_reply(email.body)[:self.BATCH_BODY_CHARS],
+            rag_context=rag_context or "No additional context available"
+        )
+    
+    def _batch_slices(self, emails: list[Email], rag_contexts: list[Optional[str]]) -> list[tuple[int, int]]:
+        """Split emails into consecutive (start, stop) runs whose batched prompt fits prompt_token_budget."""
+        budget = self.prompt_token_budget * self.CHARS_PER_TOKEN - len(SIGNAL_BATCH_EXTRACTION_PROMPT)
+        slices = []
+        start, used = 0, 0
+        for pos, (email, rag_context) in enumerate(zip(emails, rag_contexts)):
+            cost = len(self._batch_block(pos - start + 1, email, rag_context)) + 2
+            if pos > start and used + cost > budget:
+                slices.append((start, pos))
+                start, used = pos, len(self._batch_block(1, email, rag_context)) + 2
+            else:
+                used += cost
+        slices.append((start, len(emails)))
+        return slices
+    
+    def _extract_signals_prompt(
+        self,
+        emails: list[Email],
+        rag_contexts: list[Optional[str]],
+        today: datetime
+    ) -> list[Signal]:
+        """Extract signals for emails that share one batched prompt."""
+        try:
+            blocks = [
+                self._batch_block(idx, email, rag_context)
+                for idx, (email, rag_context) in enumerate(zip(emails, rag_contexts), start=1)
+            ]
+            prompt = SIGNAL_BATCH_EXTRACTION_PROMPT.format(
+                count=len(emails),
+                emails="\n\n".join(blocks),
+                today=today.strftime("%Y-%m-%d"),
+                day_of_week=today.strftime("%A")
+            )
+            
+            response = self.llm.generate(prompt)
+            
+            if not response:
+                logger.warning("LLM unavailable — deterministic fallback used")
+                return [self._fallback_heuristic(email) for email in emails]
+            
+            # Line-by-line parsing of "[n] key: value" entries
+            per_email = [{} for _ in emails]
+            for line in response.lower().split('\n'):
+                match = _BATCH_LINE_RE.match(line.strip())
+                if not match:
+                    continue
+                idx, key, val = int(match.group(1)), match.group(2), match.group(3)
+                if not 1 <= idx <= len(emails):
+                    continue
+                if key == "quantity_changed":
+                    key = "quantity_change_mentioned"
+                per_email[idx - 1][key] = 'true' in val
+            
+            # Emails the batched answer skipped are asked individually
+            return [
+                self._cache_signal(email, rag_context, self._build_signal(email, signals, response)) if signals
+                else self.extract_signals(email, rag_context, today)
+                for email, rag_context, signals in zip(emails, rag_contexts, per_email)
+            ]
+            
+        except Exception as e:
+            logger.error(f"Batch signal extraction failed: {e}")
+            logger.warning("LLM unavailable — deterministic fallback used")
+            return [self._fallback_heuristic(email) for email in emails]
+    
+    def _build_signal(self, email: Email, signals: dict[str, bool], response: str) -> Signal:
+        """Apply heuristic backup to parsed LLM signals and build the Signal."""
+        # If LLM fails OR returns empty signals, apply fallback heuristics
+        if not response or not any(signals.values()):
+            if not response:
+                logger.warning("LLM unavailable — deterministic fallback used")
+            else:
+                logger.debug("LLM returned all FALSE - checking heuristics as backup")
+            
+            heuristic_signals = self._get_heuristic_signals(email)
+            if any(heuristic_signals.values()):
+                if not response:
+                    logger.info("LLM unavailable — deterministic fallback used")
+                else:
+                    logger.info("Heuristics detected signal missed by LLM")
+                signals.update({k: v for k, v in heuristic_signals.items() if v})
+
+        logger.info(f"Extracted signals: {signals}")
+        
+        # Parse signal with validation
+        return Signal(
+            delay_mentioned=signals.get("delay_mentioned", False),
+            quantity_change_mentioned=signals.get("quantity_change_mentioned", False),
+            eta_changed=signals.get("eta_changed", False),
+            # Use defaults for the rest
+            urgency_level=UrgencyLevel.LOW,
+            commitment_confidence=CommitmentConfidence.MEDIUM,
+            supplier_sentiment=SupplierSentiment.NEUTRAL,
+            ambiguity_detected=False
+        )
             
     def _get_heuristic_signals(self, email: Email) -> dict[str, bool]:
         """Apply lightweight keyword heuristics to infer boolean signals."""
@@ -72,15 +72,31 @@ def test_bom_priority_wars():
         ], ['sales_order_id', 'model', 'version', 'quantity', 'order_type'])
         
         # Test demand calculation for part P300
-        part_demand = arbiter._calculate_part_demand("P300", mock_sales_data)
+        part_demand, _ = arbiter._calculate_part_demand("P300", mock_sales_data)
         if part_demand:
             print(f"✅ Part demand calculated: {len(part_demand)} entries")
-            print(f"   P300 demand: {part_demand[0].get('total_quantity')} units")
+            print(f"   P300 demand: {part_demand[0].total_quantity} units")
         else:
             print("❌ Part demand calculation failed")
         
-        # Test 6: Inventory Balancer integration
-        print("\n6. Testing Inventory Balancer integration...")
+        # Test 6: Oversubscribed tier packing
+        print("\n6. Testing oversubscribed tier packing...")
+        from hugo.agents.priority_arbiter import PartDemand
+        
+        tier = [
+            PartDemand(order_id, 'fleet_framework', 'S1', 'V1', qty, 1, qty)
+            for order_id, qty in [('K1', 6), ('K2', 5), ('K3', 5)]
+        ]
+        allocation, counts, _ = arbiter._allocate_part_stock(10, arbiter._group_by_priority(tier))
+        fulfilled_ids = [result.order_id for result in allocation["fulfilled"]]
+        if fulfilled_ids == ['K2', 'K3'] and counts["partial"] == 0 and counts["delayed"] == 1:
+            print("✅ Tier packed exactly (K2 + K3 fill 10 units, K1 delayed)")
+        else:
+            print(f"❌ Unexpected tier allocation: {fulfilled_ids}, {counts}")
+            return False
+        
+        # Test 7: Inventory Balancer integration
+        print("\n7. Testing Inventory Balancer integration...")
         from inventory_balancer import InventoryBalancer
         
         balancer = InventoryBalancer()
@@ -0,0 +1,149 @@
+"""
+Hugo - Agent lifecycle tests
+
+Run: pytest tests/ -v
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from main import HugoAgent, check_llm_provider_status
+
+
+class ClosingStub:
+    """Stands in for a service that holds resources open."""
+
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    # No token: skips the background warm-up call
+    monkeypatch.delenv("HF_TOKEN", raising=False)
+    return HugoAgent()
+
+
+class TestAgentClose:
+    """HugoAgent must release its worker pool and open services."""
+
+    def test_close_shuts_down_pool(self, agent):
+        agent.close()
+
+        with pytest.raises(RuntimeError):
+            agent._pool.submit(print)
+
+    def test_context_manager_closes(self, agent):
+        with agent as entered:
+            assert entered is agent
+
+        with pytest.raises(RuntimeError):
+            agent._pool.submit(print)
+
+    def test_close_closes_built_balancer(self, agent):
+        balancer = ClosingStub()
+        agent.__dict__["inventory_balancer"] = balancer
+
+        agent.close()
+
+        assert balancer.closed
+
+    def test_close_does_not_build_balancer(self, agent):
+        agent.close()
+
+        assert "inventory_balancer" not in agent.__dict__
+
+
+class TestLLMProviderStatus:
+    """The memoized provider status must not be shared mutable state."""
+
+    def test_mutating_status_does_not_leak(self, monkeypatch):
+        monkeypatch.setenv("HF_TOKEN", "hf_test")
+
+        status = check_llm_provider_status()
+        status["available"] = False
+        status["model"] = "other"
+
+        fresh = check_llm_provider_status()
+        assert fresh["available"] is True
+        assert fresh["model"] != "other"
+        assert fresh is not status
+
+
+class TestWarmUp:
+    """The startup warm-up must not hold a pipeline worker or use a separate client."""
+
+    def test_warm_up_uses_detector_client_off_the_pool(self, monkeypatch):
+        import threading
+        from config.settings import settings
+        from services.huggingface_llm import HuggingFaceLLM
+
+        calls = []
+        monkeypatch.setenv("HF_TOKEN", "hf_test")
+        monkeypatch.setattr(settings, "HF_WARMUP", True)
+        monkeypatch.setattr(HuggingFaceLLM, "warm_up", lambda llm: calls.append((llm, threading.current_thread())))
+
+        agent = HugoAgent()
+        for thread in threading.enumerate():
+            if thread.name == "hugo-llm-warmup":
+                thread.join(timeout=10)
+
+        (llm, thread), = calls
+        assert llm is agent.detector.signal_extractor.llm
+        assert thread.daemon and not thread.name.startswith("hugo-pipeline")
+        agent.close()
+
+
+class RecordingDetector:
+    """Detector stub that records the emails sent for batched detection."""
+
+    def __init__(self):
+        self.batched = []
+
+    def detect_changes_batch(self, emails, pos=None, rag_contexts=None, executor=None):
+        from models.schemas import DeliveryChange, Signal
+        self.batched.extend(email.message_id for email in emails)
+        return [(DeliveryChange(), Signal()) for _ in emails]
+
+
+class TestIterAlerts:
+    """Batched detection only covers emails whose context was prepared."""
+
+    def test_failed_context_emails_stay_out_of_the_batch(self, agent):
+        from datetime import datetime
+        from types import SimpleNamespace
+        from models.schemas import Email
+
+        emails = [
+            Email(message_id=f"m{idx}", thread_id=f"t{idx}", sender=f"s{idx}@supplier.com",
+                  subject=f"PO-2024-0000{idx} delivery update", body="Shipment delayed.",
+                  received_at=datetime(2024, 1, 1))
+            for idx in (1, 2, 3)
+        ]
+        agent.__dict__.update(
+            email_service=SimpleNamespace(fetch_emails=lambda query=None, max_results=10: emails),
+            erp=object(), vector_store=object(), risk_engine=object()
+        )
+        agent._detector = RecordingDetector()
+        agent._try_prepare_email_context = lambda email: None if email.message_id == "m2" else (None, None, "ctx")
+        seen = {}
+
+        def process(email, po_reference=None, detection=None, **kwargs):
+            seen[email.message_id] = detection
+            return None
+
+        agent._process_single_email = process
+
+        list(agent.iter_alerts())
+
+        assert agent._detector.batched == ["m1", "m3"]
+        assert seen["m2"] is None and seen["m1"] is not None and seen["m3"] is not None
+        agent.close()
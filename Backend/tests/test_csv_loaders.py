@@ -0,0 +1,102 @@
+"""
+Hugo - CSV loader equivalence tests
+
+Run: pytest tests/ -v
+"""
+
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import inventory_balancer
+from inventory_balancer import InventoryBalancer
+
+SAMPLES_DIR = Path(__file__).parent.parent / "hugo_data_samples"
+
+# Keep every sample row regardless of today's date
+ALL_DAYS = "0000-00-00"
+
+pytestmark = pytest.mark.skipif(inventory_balancer.pd is None, reason="pandas not installed")
+
+
+def parse_both(monkeypatch, data_dir):
+    """Parse sales and stock CSVs with pandas, then with the csv row parser."""
+    monkeypatch.setenv("HF_TOKEN", "test-token")
+    balancer = InventoryBalancer(data_dir=str(data_dir), use_memo_cache=False)
+
+    def parse():
+        sales = balancer._parse_sales_data(30, ALL_DAYS)
+        return {material: list(quantities) for material, quantities in sales.items()}, balancer._parse_stock_levels()
+
+    with_pandas = parse()
+    monkeypatch.setattr(inventory_balancer, "pd", None)
+    return with_pandas, parse()
+
+
+def samples_with_extra_rows(tmp_path, sales_rows="", stock_rows=""):
+    """Copy the sample CSVs into tmp_path, appending extra rows."""
+    for name, extra in (("sales_orders.csv", sales_rows), ("stock_levels.csv", stock_rows)):
+        shutil.copy(SAMPLES_DIR / name, tmp_path / name)
+        with open(tmp_path / name, "a", encoding="utf-8") as f:
+            f.write(extra)
+    return tmp_path
+
+
+class TestPandasLoaderEquivalence:
+    """The pandas fast path must return exactly what the csv row parser returns."""
+
+    def test_sample_csvs(self, monkeypatch):
+        with_pandas, with_csv = parse_both(monkeypatch, SAMPLES_DIR)
+
+        assert with_pandas[0] and with_pandas[1]
+        assert with_pandas == with_csv
+
+    def test_blank_sales_cells(self, monkeypatch, tmp_path):
+        data_dir = samples_with_extra_rows(tmp_path, sales_rows=(
+            "S9000,S1,V1,,webshop,2025-03-03,2025-01-01,2025-01-02\n"
+            "S9001,,V1,5,webshop,2025-03-03,2025-01-01,2025-01-02\n"
+            "S9002,S2,V1,7,webshop,,2025-01-01,2025-01-02\n"
+            "S9003,S2,V1,3\n"
+        ))
+
+        with_pandas, with_csv = parse_both(monkeypatch, data_dir)
+
+        assert with_pandas[0] == with_csv[0]
+        assert with_pandas[0][""] == [5.0]
+
+    def test_blank_stock_cells(self, monkeypatch, tmp_path):
+        data_dir = samples_with_extra_rows(tmp_path, stock_rows=(
+            "P900,Blank quantity,WH1,\n"
+            ",Blank part id,WH1,4\n"
+            "P901,Short row\n"
+        ))
+
+        with_pandas, with_csv = parse_both(monkeypatch, data_dir)
+
+        assert with_pandas[1] == with_csv[1]
+        assert "P900" not in with_pandas[1] and with_pandas[1][""] == 4
+
+    def test_non_integer_stock_is_skipped(self, monkeypatch, tmp_path):
+        data_dir = samples_with_extra_rows(tmp_path, stock_rows="P902,Float quantity,WH1,7.0\n")
+
+        with_pandas, with_csv = parse_both(monkeypatch, data_dir)
+
+        assert with_pandas[1] == with_csv[1]
+        assert "P902" not in with_pandas[1]
+
+    def test_malformed_dates_are_skipped(self, monkeypatch, tmp_path):
+        data_dir = samples_with_extra_rows(tmp_path, sales_rows=(
+            "S9100,S1,V1,7,webshop,2025-13-45,2025-01-01,2025-01-02\n"
+            "S9101,S1,V1,8,webshop,2025/01/05,2025-01-01,2025-01-02\n"
+            "S9102,S1,V1,9,webshop,2025-02-30,2025-01-01,2025-01-02\n"
+        ))
+
+        with_pandas, with_csv = parse_both(monkeypatch, data_dir)
+        with_samples, _ = parse_both(monkeypatch, SAMPLES_DIR)
+
+        assert with_pandas[0] == with_csv[0] == with_samples[0]
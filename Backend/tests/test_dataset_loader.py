@@ -0,0 +1,51 @@
+"""
+Hugo - Dataset loader tests
+
+Run: pytest tests/ -v
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data.dataset_loader import DatasetLoader, SimpleDataFrame
+
+SAMPLES_DIR = Path(__file__).parent.parent / "hugo_data_samples"
+
+BOM_COLUMNS = ['model', 'version', 'part_id', 'qty_per_unit']
+
+
+def loader_with_bom(rows):
+    loader = DatasetLoader(str(SAMPLES_DIR))
+    loader.bom = SimpleDataFrame(rows, BOM_COLUMNS)
+    return loader
+
+
+class TestBomIndex:
+    """A malformed BOM row must not break the BOM lookups."""
+
+    def test_malformed_qty_row_is_skipped(self):
+        loader = loader_with_bom([
+            {'model': 'S1', 'version': 'V1', 'part_id': 'P300', 'qty_per_unit': '2'},
+            {'model': 'S1', 'version': 'V1', 'part_id': 'P301', 'qty_per_unit': 'two'},
+            {'model': 'S1', 'version': 'V1', 'part_id': 'P302', 'qty_per_unit': ''},
+        ])
+
+        assert loader.get_bom_part_quantities() == {('S1', 'V1'): {'P300': 2}}
+        assert loader.get_part_bom('P300') == {('S1', 'V1'): 2}
+        assert loader.get_part_bom('P301') == {}
+        # The raw mapping still lists every row, as before the index existed
+        assert len(loader.get_bom_mapping('S1', 'V1')) == 3
+
+    def test_index_is_built_once(self):
+        loader = loader_with_bom([
+            {'model': 'S1', 'version': 'V1', 'part_id': 'P301', 'qty_per_unit': 'two'},
+        ])
+
+        loader.get_part_bom('P301')
+        index = loader._bom_by_part
+        loader.get_part_bom('P301')
+
+        assert loader._bom_by_part is index
@@ -0,0 +1,108 @@
+"""
+Hugo - Gmail message parsing tests
+
+Run: pytest tests/ -v
+"""
+
+import base64
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.email_ingestion import EmailIngestionService
+
+
+def b64(text):
+    return base64.urlsafe_b64encode(text.encode()).decode()
+
+
+def make_service():
+    """EmailIngestionService without Gmail authentication."""
+    service = EmailIngestionService.__new__(EmailIngestionService)
+    service.service = None
+    return service
+
+
+def make_message(sender, payload_body=None):
+    payload = payload_body or {'mimeType': 'text/plain', 'body': {'data': b64("Shipment on time.")}}
+    payload['headers'] = [
+        {'name': 'From', 'value': sender},
+        {'name': 'Subject', 'value': 'PO-2024-00001 update'},
+        {'name': 'Date', 'value': 'Mon, 01 Jan 2024 10:00:00 +0000'},
+    ]
+    return {'id': 'm1', 'threadId': 't1', 'payload': payload}
+
+
+class TestSenderParsing:
+    """_parse_message splits the From header into name and address."""
+
+    def test_bare_address(self):
+        msg = make_message("orders@supplier.com")
+
+        email = make_service()._parse_message({'id': 'm1', 'threadId': 't1'}, msg)
+
+        assert email.sender == "orders@supplier.com"
+        assert not email.sender_name
+
+    def test_display_name(self):
+        msg = make_message("Jane Doe <jane@supplier.com>")
+
+        email = make_service()._parse_message({'id': 'm1', 'threadId': 't1'}, msg)
+
+        assert email.sender == "jane@supplier.com"
+        assert email.sender_name == "Jane Doe"
+
+    def test_quoted_display_name_with_comma(self):
+        msg = make_message('"Doe, Jane" <jane@supplier.com>')
+
+        email = make_service()._parse_message({'id': 'm1', 'threadId': 't1'}, msg)
+
+        assert email.sender == "jane@supplier.com"
+        assert email.sender_name == "Doe, Jane"
+
+    def test_prefetched_message_skips_fetch(self):
+        # service is None: any fetch attempt would fail and return None
+        email = make_service()._parse_message({'id': 'm1', 'threadId': 't1'}, make_message("a@b.com"))
+
+        assert email is not None
+        assert email.body == "Shipment on time."
+
+
+class TestBodyExtraction:
+    """_extract_body prefers text/plain and converts HTML only as a fallback."""
+
+    def test_plain_and_html_prefers_plain(self):
+        payload = {'mimeType': 'multipart/alternative', 'parts': [
+            {'mimeType': 'text/html', 'body': {'data': b64("<p>HTML version</p>")}},
+            {'mimeType': 'text/plain', 'body': {'data': b64("Plain version")}},
+        ]}
+
+        assert make_service()._extract_body(payload) == "Plain version"
+
+    def test_html_only_is_converted(self):
+        payload = {'mimeType': 'multipart/alternative', 'parts': [
+            {'mimeType': 'text/html', 'body': {'data': b64("<p>Delivery <b>delayed</b></p>")}},
+        ]}
+
+        body = make_service()._extract_body(payload)
+
+        assert "Delivery" in body and "delayed" in body
+        assert "<p>" not in body
+
+    def test_empty_parts_are_skipped(self):
+        payload = {'mimeType': 'multipart/mixed', 'parts': [
+            {'mimeType': 'text/plain', 'body': {'size': 0}},
+            {'mimeType': 'application/pdf', 'body': {'attachmentId': 'a1'}},
+            {'mimeType': 'text/html', 'body': {'data': b64("<p>Only HTML</p>")}},
+        ]}
+
+        assert "Only HTML" in make_service()._extract_body(payload)
+
+    def test_no_text_parts(self):
+        payload = {'mimeType': 'multipart/mixed', 'parts': [
+            {'mimeType': 'application/pdf', 'body': {'attachmentId': 'a1'}},
+        ]}
+
+        assert make_service()._extract_body(payload) == ""
@@ -0,0 +1,65 @@
+"""
+Hugo - Text helper tests
+
+Run: pytest tests/ -v
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.helpers import clean_text, strip_quoted_reply
+
+
+class TestStripQuotedReply:
+    """strip_quoted_reply drops reply history but never real content."""
+
+    def test_on_wrote_header(self):
+        body = (
+            "Delivery for PO-2024-00001 slips by 5 days.\n\n"
+            "On Mon, 1 Jan 2024 at 10:00, Buyer <buyer@acme.com> wrote:\n"
+            "> Can you confirm the date?"
+        )
+
+        assert strip_quoted_reply(body) == "Delivery for PO-2024-00001 slips by 5 days."
+
+    def test_on_wrote_header_in_collapsed_body(self):
+        body = clean_text(
+            "Delivery slips by 5 days.\n\n"
+            "On Mon, 1 Jan 2024, Buyer <buyer@acme.com> wrote:\n"
+            "> Can you confirm the date?\n> Thanks"
+        )
+
+        assert strip_quoted_reply(body) == "Delivery slips by 5 days."
+
+    def test_outlook_separator(self):
+        body = "Revised ETA is 12 March.\n\n-----Original Message-----\nFrom: buyer@acme.com"
+
+        assert strip_quoted_reply(body) == "Revised ETA is 12 March."
+
+    def test_trailing_quoted_block(self):
+        body = "Quantity reduced to 40 units.\n\n> How many can you ship?\n>\n> Regards\n"
+
+        assert strip_quoted_reply(body) == "Quantity reduced to 40 units."
+
+    def test_inline_quotes_are_kept(self):
+        body = "Answers below:\n> New date?\n15 March.\n> Quantity?\n40 units."
+
+        assert strip_quoted_reply(body) == body
+
+    def test_no_quote_is_unchanged(self):
+        body = "Shipment for PO-2024-00001 is on schedule.\nQty > 5 pallets.\n"
+
+        assert strip_quoted_reply(body) == body
+
+    def test_wrote_in_prose_is_kept(self):
+        body = "Update: On Monday our carrier wrote: the pallets were damaged. New ETA is Friday."
+
+        assert strip_quoted_reply(body) == body
+
+    def test_body_that_is_only_a_quote_is_kept(self):
+        body = "> Please confirm delivery\n> Thanks"
+
+        assert strip_quoted_reply(body) == body
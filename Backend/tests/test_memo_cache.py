@@ -0,0 +1,76 @@
+"""
+Hugo - Inventory memo cache tests
+
+Run: pytest tests/ -v
+"""
+
+import shelve
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from inventory_balancer import InventoryBalancer
+
+
+class CountingLLM:
+    """LLM stub that counts generate() calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate(self, prompt):
+        self.calls += 1
+        return f"Memo number {self.calls} for the inventory manager."
+
+
+def make_balancer(monkeypatch, **kwargs):
+    monkeypatch.setenv("HF_TOKEN", "test-token")
+    balancer = InventoryBalancer(**kwargs)
+    balancer.llm = CountingLLM()
+    return balancer
+
+
+def memo(balancer, material_id):
+    return balancer.generate_manager_memo(material_id, 100, 2.0, 50.0, 0.5, "HIGH")
+
+
+class TestMemoCache:
+    """On-disk memo cache: opt-in location, bounded size, closed cleanly."""
+
+    def test_disabled_cache_never_touches_disk(self, monkeypatch, tmp_path):
+        path = tmp_path / "memos"
+        balancer = make_balancer(monkeypatch, memo_cache_path=str(path), use_memo_cache=False)
+
+        memo(balancer, "P300")
+        memo(balancer, "P300")
+        balancer.close()
+
+        assert balancer.llm.calls == 2
+        assert not list(tmp_path.iterdir())
+
+    def test_cached_memo_survives_close_and_reopen(self, monkeypatch, tmp_path):
+        path = str(tmp_path / "memos")
+        with make_balancer(monkeypatch, memo_cache_path=path, use_memo_cache=True) as balancer:
+            first = memo(balancer, "P300")
+
+        with make_balancer(monkeypatch, memo_cache_path=path, use_memo_cache=True) as balancer:
+            assert memo(balancer, "P300") == first
+            assert balancer.llm.calls == 0
+
+    def test_cache_is_bounded(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(InventoryBalancer, "MEMO_CACHE_MAX_ENTRIES", 8)
+        path = str(tmp_path / "memos")
+        with make_balancer(monkeypatch, memo_cache_path=path, use_memo_cache=True) as balancer:
+            for index in range(20):
+                memo(balancer, f"P{index}")
+
+        with shelve.open(path) as cache:
+            assert len(cache) <= 8
+
+    def test_close_is_idempotent(self, monkeypatch, tmp_path):
+        balancer = make_balancer(monkeypatch, memo_cache_path=str(tmp_path / "memos"), use_memo_cache=True)
+        memo(balancer, "P300")
+        balancer.close()
+        balancer.close()
@@ -0,0 +1,213 @@
+"""
+Hugo - Priority conflict detection tests
+
+Run: pytest tests/ -v
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data.dataset_loader import SimpleDataFrame
+from hugo.agents.priority_arbiter import PriorityArbiter
+from inventory_balancer import InventoryBalancer, InventoryRecommendation
+
+
+SALES_COLUMNS = ['sales_order_id', 'model', 'version', 'quantity', 'order_type']
+
+
+class FakeLoader:
+    """Dataset loader stub: S1/V1 uses 2x P300 per unit."""
+
+    def __init__(self, rows):
+        self.sales_orders = SimpleDataFrame(rows, SALES_COLUMNS)
+
+    def get_bom_part_quantities(self):
+        return {("S1", "V1"): {"P300": 2}}
+
+    def get_part_bom(self, part_id):
+        return {("S1", "V1"): 2} if part_id == "P300" else {}
+
+
+def make_balancer(rows):
+    """InventoryBalancer wired to a stub loader (no CSVs, no LLM)."""
+    loader = FakeLoader(rows)
+    balancer = InventoryBalancer.__new__(InventoryBalancer)
+    balancer.dataset_loader = loader
+    balancer.priority_arbiter = PriorityArbiter(dataset_loader=loader)
+    return balancer
+
+
+def make_recommendation(material_id, current_stock):
+    return InventoryRecommendation(
+        material_id=material_id,
+        avg_daily_demand=1.0,
+        volatility=0.0,
+        current_stock=current_stock,
+        recommendation="KEEP_STOCK",
+        confidence="HIGH"
+    )
+
+
+class TestDetectPriorityConflicts:
+    """detect_priority_conflicts must survive malformed sales order rows."""
+
+    def test_malformed_quantity_row_is_skipped(self):
+        balancer = make_balancer([
+            {'sales_order_id': 'K1', 'model': 'S1', 'version': 'V1', 'quantity': '5', 'order_type': 'fleet_framework'},
+            {'sales_order_id': 'K2', 'model': 'S1', 'version': 'V1', 'quantity': '', 'order_type': 'webshop'},
+            {'sales_order_id': 'K3', 'model': 'S1', 'version': 'V1', 'quantity': 'abc', 'order_type': 'webshop'},
+            {'sales_order_id': 'K4', 'model': 'S1', 'version': 'V1', 'quantity': '3', 'order_type': 'webshop'},
+        ])
+
+        conflicts = balancer.detect_priority_conflicts([make_recommendation("P300", 10)])
+
+        # Only K1 (10 units) and K4 (6 units) count: 16 > 10 in stock
+        assert len(conflicts) == 1
+        assert conflicts[0].material == "P300"
+        assert conflicts[0].total_demand == 16
+        assert conflicts[0].delayed_orders == ["K4"]
+
+    def test_only_malformed_rows_yields_no_conflict(self):
+        balancer = make_balancer([
+            {'sales_order_id': 'K1', 'model': 'S1', 'version': 'V1', 'quantity': '', 'order_type': 'webshop'},
+        ])
+
+        assert balancer.detect_priority_conflicts([make_recommendation("P300", 0)]) == []
+
+
+class CountingLLM:
+    """LLM stub that counts generate() calls."""
+
+    def __init__(self, response="We are sorry: high demand delayed your order; fleet contracts ship first."):
+        self.response = response
+        self.calls = 0
+
+    def generate(self, prompt):
+        self.calls += 1
+        return self.response
+
+
+def oversubscribed_orders():
+    return SimpleDataFrame([
+        {'sales_order_id': 'K1', 'model': 'S1', 'version': 'V1', 'quantity': '5', 'order_type': 'fleet_framework'},
+        {'sales_order_id': 'K2', 'model': 'S1', 'version': 'V1', 'quantity': '5', 'order_type': 'webshop'},
+    ], SALES_COLUMNS)
+
+
+class TestPriorityResolutionExplanation:
+    """Explanations are an explicit, on-request LLM call."""
+
+    def test_explanation_is_an_init_field(self):
+        from hugo.agents.priority_arbiter import PriorityResolution
+
+        resolution = PriorityResolution(
+            material="P300",
+            available_stock=0,
+            total_demand=0,
+            allocation={"fulfilled": [], "partial": [], "delayed": []},
+            delayed_orders=[],
+            summary="",
+            explanation="Custom text"
+        )
+        assert resolution.explanation == "Custom text"
+
+    def test_arbitration_does_not_call_llm(self):
+        llm = CountingLLM()
+        arbiter = PriorityArbiter(llm_client=llm, dataset_loader=FakeLoader([]))
+
+        resolution = arbiter.resolve_conflict("P300", 10, oversubscribed_orders())
+
+        assert resolution.delayed_orders == ["K2"]
+        assert resolution.explanation is None
+        assert llm.calls == 0
+
+    def test_explain_calls_llm_on_request(self):
+        llm = CountingLLM()
+        arbiter = PriorityArbiter(llm_client=llm, dataset_loader=FakeLoader([]))
+        resolution = arbiter.resolve_conflict("P300", 10, oversubscribed_orders())
+
+        assert arbiter.explain(resolution) == llm.response.replace("'", "")
+        assert llm.calls == 1
+
+    def test_explain_is_memoized_per_resolution(self):
+        llm = CountingLLM()
+        arbiter = PriorityArbiter(llm_client=llm, dataset_loader=FakeLoader([]))
+        orders = oversubscribed_orders()
+
+        first = arbiter.explain(arbiter.resolve_conflict("P300", 10, orders))
+        again = arbiter.explain(arbiter.resolve_conflict("P300", 10, orders))
+
+        assert first == again
+        assert llm.calls == 1
+
+    def test_explain_returns_explanation_already_set(self):
+        from dataclasses import replace
+
+        llm = CountingLLM()
+        arbiter = PriorityArbiter(llm_client=llm, dataset_loader=FakeLoader([]))
+        resolution = replace(arbiter.resolve_conflict("P300", 10, oversubscribed_orders()), explanation="Custom text")
+
+        assert arbiter.explain(resolution) == "Custom text"
+        assert llm.calls == 0
+
+    def test_failed_explanation_is_retried(self):
+        llm = CountingLLM(response="")
+        arbiter = PriorityArbiter(llm_client=llm, dataset_loader=FakeLoader([]))
+        resolution = arbiter.resolve_conflict("P300", 10, oversubscribed_orders())
+
+        assert arbiter.explain(resolution) is None
+        llm.response = "We are sorry: high demand delayed your order."
+        assert arbiter.explain(resolution) == llm.response
+        assert llm.calls == 2
+
+
+class TestResolutionCache:
+    """Cached resolutions must track the orders and never be shared."""
+
+    def test_cache_hit_returns_private_copy(self):
+        arbiter = PriorityArbiter(dataset_loader=FakeLoader([]))
+        orders = oversubscribed_orders()
+
+        first = arbiter.resolve_conflict("P300", 10, orders)
+        first.allocation["delayed"].clear()
+        first.delayed_orders.append("BOGUS")
+
+        second = arbiter.resolve_conflict("P300", 10, orders)
+        assert second.delayed_orders == ["K2"]
+        assert [r.order_id for r in second.allocation["delayed"]] == ["K2"]
+
+        second.delayed_orders.clear()
+        assert arbiter.resolve_conflict("P300", 10, orders).delayed_orders == ["K2"]
+
+    def test_orders_edited_in_place_miss_the_cache(self):
+        arbiter = PriorityArbiter(dataset_loader=FakeLoader([]))
+        orders = oversubscribed_orders()
+        assert arbiter.resolve_conflict("P300", 10, orders).total_demand == 20
+
+        orders.data[1]['quantity'] = '1'
+        assert arbiter.resolve_conflict("P300", 10, orders).total_demand == 12
+
+    def test_orders_replaced_miss_the_cache(self):
+        arbiter = PriorityArbiter(dataset_loader=FakeLoader([]))
+        orders = oversubscribed_orders()
+        assert arbiter.resolve_conflict("P300", 10, orders).total_demand == 20
+
+        orders.data = orders.data[:1]
+        assert arbiter.resolve_conflict("P300", 10, orders).total_demand == 10
+
+    def test_cache_keys_do_not_hold_the_order_table(self):
+        arbiter = PriorityArbiter(dataset_loader=FakeLoader([]))
+        orders = oversubscribed_orders()
+        arbiter.resolve_conflict("P300", 10, orders)
+        arbiter.resolve_conflict("P300", 5, orders)
+
+        assert all(isinstance(key[2], int) for key in arbiter._resolution_cache)
+
+        orders.data[0]['quantity'] = '2'
+        arbiter.resolve_conflict("P300", 10, orders)
+
+        # Entries for the old orders are dropped, not kept alongside
+        assert len(arbiter._resolution_cache) == 1
@@ -10,6 +10,8 @@ import logging
 from datetime import datetime
 from typing import Optional
 
+from models.schemas import ChangeType
+
 
 def setup_logging(level: str = "INFO") -> logging.Logger:
     """
@@ -61,6 +63,35 @@ def clean_text(text: str) -> str:
     return text
 
 
+# Start of the quoted history in a reply: an "On <date>, <name> wrote:" header
+# (mail clients always put a date or time in it, which keeps "On Monday the
+# carrier wrote: ..." in running prose intact), an Outlook
+# "-----Original Message-----" separator, or a trailing block of ">" lines.
+# The first two also match bodies that clean_text() has collapsed onto one line
+_QUOTED_REPLY_RE = re.compile(
+    r'\bOn\s[^\n\d]{0,200}\d[^\n]{0,200}?\swrote:'
+    r'|-{2,}\s*Original Message\s*-{2,}'
+    r'|^>.*(?:\n(?:>.*|[ \t]*))*\Z',
+    re.MULTILINE
+)
+
+
+def strip_quoted_reply(text: str) -> str:
+    """
+    Drop quoted reply history from an email body.
+    
+    Args:
+        text: Email body
+    
+    Returns:
+        Body up to the first reply marker (unchanged if it starts with one)
+    """
+    match = _QUOTED_REPLY_RE.search(text)
+    if not match or match.start() == 0:
+        return text
+    return text[:match.start()].rstrip()
+
+
 def parse_date_flexible(date_str: str) -> Optional[datetime]:
     """
     Parse date string in various formats.
@@ -116,3 +147,21 @@ def extract_po_reference(text: str) -> Optional[str]:
             return match.group(1).upper()
     
     return None
+
+
+# Label strings for every change type, looked up instead of walking .value
+_CHANGE_TYPE_LABELS = {change_type: change_type.value for change_type in ChangeType}
+
+
+def change_type_label(change_type: Optional[ChangeType], default: Optional[str] = "unknown") -> Optional[str]:
+    """
+    Get the display label for a change type.
+    
+    Args:
+        change_type: ChangeType or None
+        default: Label to use when no change type is set
+    
+    Returns:
+        Change type value, or default
+    """
+    return _CHANGE_TYPE_LABELS.get(change_type, default)
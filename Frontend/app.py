@@ -1,5 +1,6 @@
 import streamlit as st
-import pandas as pd
+import pyarrow as pa
+import atexit
 import sys
 import os
 from PIL import Image
@@ -190,6 +191,11 @@ st.markdown("""
     .stTabs [data-baseweb="tab-list"] { justify-content: center; width: 100%; gap: 20px; }
     .stTabs [data-baseweb="tab"] { height: 40px; background-color: #F4F5F7; border-radius: 8px; padding: 12px 30px; font-weight: 900; color: #5E6C84; border: 1px solid #dfe1e6; }
     .stTabs [aria-selected="true"] { background-color: #FFFFFF; color: #0052CC; border: 2px solid #0052CC; }
+    .chat-history { display: flex; flex-direction: column; gap: 10px; margin-bottom: 10px; }
+    .chat-history .msg { padding: 10px 14px; border-radius: 8px; max-width: 85%; }
+    .chat-history .msg > :last-child { margin-bottom: 0; }
+    .chat-history .msg.user { align-self: flex-end; background-color: #E9F2FF; }
+    .chat-history .msg.assistant { align-self: flex-start; background-color: #FFFFFF; border: 1px solid #dfe1e6; }
     .footer { width: 100%; text-align: center; padding: 20px; margin-top: 50px; border-top: 1px solid #eaeaea; color: #6B778C; font-size: 14px; font-weight: 500; }
 </style>
 """, unsafe_allow_html=True)
@@ -214,6 +220,8 @@ def init_hugo():
     if HUGO_AVAILABLE:
         try:
             agent = HugoAgent(simulation_mode=False)
+            # The cached agent outlives every rerun; stop its worker pool with the server
+            atexit.register(agent.close)
             print("✅ Hugo Agent initialized")
             return agent
         except Exception as e:
@@ -455,9 +463,13 @@ with tab_data:
         try:
             orders = st.session_state.hugo_agent.get_open_orders()
             if orders:
-                po_data = pd.DataFrame([{
-                    "PO": po.po_number, "Supplier": po.supplier_name, "Material": po.material_id, "Qty": po.quantity
-                } for po in orders])
+                # Arrow table goes straight to the frontend (no pandas -> Arrow conversion per rerun)
+                po_data = pa.table({
+                    "PO": [po.po_number for po in orders],
+                    "Supplier": [po.supplier_name for po in orders],
+                    "Material": [po.material_id for po in orders],
+                    "Qty": pa.array([po.quantity for po in orders], type=pa.int64())
+                })
                 st.dataframe(po_data, use_container_width=True)
             else:
                 st.info("No POs found.")
@@ -467,12 +479,13 @@ with tab_data:
     st.divider()
     st.markdown("### 📜 Alert History")
     if st.session_state.processed_alerts:
-        alert_data = [{
-            "Time": a.processed_at.strftime("%H:%M:%S"),
-            "Sender": a.email.sender,
-            "Subject": a.email.subject[:40]
-        } for a in st.session_state.processed_alerts]
-        st.dataframe(pd.DataFrame(alert_data), use_container_width=True)
+        alerts = st.session_state.processed_alerts
+        alert_data = pa.table({
+            "Time": [a.processed_at.strftime("%H:%M:%S") for a in alerts],
+            "Sender": [a.email.sender for a in alerts],
+            "Subject": [a.email.subject[:40] for a in alerts]
+        })
+        st.dataframe(alert_data, use_container_width=True)
 
 # ==========================================
 # TAB 5: INTELLIGENCE HUB (RAG CHAT)
@@ -487,10 +500,15 @@ with tab_hub:
             {"role": "assistant", "content": "Hello! I'm Hugo. Ask me about stock levels, delayed orders, or supplier risks."}
         ]
 
-    # 2. Display Previous Messages
-    for message in st.session_state.chat_history:
-        with st.chat_message(message["role"]):
-            st.markdown(message["content"])
+    # 2. Display Previous Messages (one markdown block instead of one chat_message per entry).
+    # Blank lines around each message let Streamlit render its content as markdown, as
+    # chat_message(...).markdown does for new replies; only "<" is escaped so message
+    # text can't inject HTML into the block
+    history_md = "".join(
+        f'<div class="msg {m["role"]}">\n\n{m["content"].replace("<", "&lt;")}\n\n</div>\n\n'
+        for m in st.session_state.chat_history
+    )
+    st.markdown(f'<div class="chat-history">\n\n{history_md}</div>', unsafe_allow_html=True)
 
     # 3. Handle User Input
     if prompt := st.chat_input("Ex: 'Do we have enough motors for the next 3 months?'"):